@@ -5,6 +5,7 @@ Automatically analyzes projects and generates documentation before bidding
 """
 
 import os
+import re
 import json
 import logging
 from typing import Dict, Optional, Tuple
@@ -18,6 +19,13 @@ from auto_sdlc_service import (
 )
 
 class SDLCBotIntegration:
+    # Development keywords as one alternation, so a project is scanned once
+    DEV_KEYWORDS_PATTERN = re.compile(
+        'develop|build|create|application|website|app|'
+        'system|platform|software|api|backend|frontend',
+        re.IGNORECASE
+    )
+    
     def __init__(self, bot_instance):
         """
         Initialize SDLC integration with bot
@@ -116,18 +124,8 @@ class SDLCBotIntegration:
                 return False
         
         # Check if it's a development project
-        description = project.get('description', '').lower()
-        title = project.get('title', '').lower()
-        
-        dev_keywords = [
-            'develop', 'build', 'create', 'application', 'website', 'app',
-            'system', 'platform', 'software', 'api', 'backend', 'frontend'
-        ]
-        
-        if any(keyword in description + title for keyword in dev_keywords):
-            return True
-        
-        return False
+        text = f"{project.get('description', '')} {project.get('title', '')}"
+        return self.DEV_KEYWORDS_PATTERN.search(text) is not None
     
     def analyze_and_generate_docs(self, project: Dict) -> Optional[Dict]:
         """
@@ -237,21 +235,23 @@ class SDLCBotIntegration:
             analysis = sdlc_analysis['analysis']
             plan = sdlc_analysis['plan_summary']
             
-            # Create enhancement
-            enhancement = f"\n\n**Project Analysis & Approach:**\n"
-            enhancement += f"• Project Type: {analysis['project_type'].replace('_', ' ').title()}\n"
-            enhancement += f"• Complexity: {analysis['complexity'].title()}\n"
-            enhancement += f"• Estimated Timeline: {plan['timeline']['total_weeks']} weeks\n"
-            enhancement += f"• Development Phases: {plan['phases']}\n"
+            # Collect the message parts and join them once
+            parts = [
+                base_message,
+                "\n\n**Project Analysis & Approach:**\n",
+                f"• Project Type: {analysis['project_type'].replace('_', ' ').title()}\n",
+                f"• Complexity: {analysis['complexity'].title()}\n",
+                f"• Estimated Timeline: {plan['timeline']['total_weeks']} weeks\n",
+                f"• Development Phases: {plan['phases']}\n",
+            ]
             
             if analysis['technologies']:
-                enhancement += f"• Recommended Tech: {', '.join(analysis['technologies'][:5])}\n"
+                parts.append(f"• Recommended Tech: {', '.join(analysis['technologies'][:5])}\n")
             
-            enhancement += f"\nI've prepared a detailed project plan with {plan['tasks']} tasks "
-            enhancement += f"and clear milestones. Happy to share the full technical documentation.\n"
+            parts.append(f"\nI've prepared a detailed project plan with {plan['tasks']} tasks "
+                         f"and clear milestones. Happy to share the full technical documentation.\n")
             
-            # Add to base message
-            enhanced_message = base_message + enhancement
+            enhanced_message = ''.join(parts)
             
             # Ensure it's not too long (Freelancer has limits)
             if len(enhanced_message) > 4000:
@@ -14,6 +14,13 @@ import time
 from dataclasses import dataclass, asdict
 import re
 
+# pyahocorasick (optional) finds every pattern keyword in one pass over the
+# description; without it each keyword is a separate substring scan
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -173,6 +180,15 @@ class AutoSDLCService:
             }
         }
         
+        # Technology keywords by technology, across all categories
+        self._tech_keywords = {
+            tech: keywords
+            for tech_groups in self.tech_patterns.values()
+            for tech, keywords in tech_groups.items()
+        }
+        self._project_type_automaton = self._build_keyword_automaton(self.project_patterns)
+        self._tech_automaton = self._build_keyword_automaton(self._tech_keywords)
+        
         logging.info(f"✓ Auto SDLC Service initialized with {ai_provider}")
     
     def _load_api_key(self) -> Optional[str]:
@@ -290,15 +306,50 @@ class AutoSDLCService:
         logging.info(f"✓ Project analyzed: {project_type} ({complexity} complexity)")
         return analysis
     
+    @staticmethod
+    def _build_keyword_automaton(keyword_groups: Dict[str, List[str]]):
+        """Aho-Corasick automaton over every keyword, yielding the names it belongs to
+        
+        Returns None when pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+        
+        names_by_keyword = {}
+        for name, keywords in keyword_groups.items():
+            for keyword in keywords:
+                names_by_keyword.setdefault(keyword, []).append(name)
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, names in names_by_keyword.items():
+            automaton.add_word(keyword, (keyword, names))
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _keyword_hits(automaton, text: str) -> Dict[str, int]:
+        """Number of distinct keywords found in text, per name"""
+        matched = dict(value for _, value in automaton.iter(text))
+        hits = {}
+        for names in matched.values():
+            for name in names:
+                hits[name] = hits.get(name, 0) + 1
+        return hits
+    
     def _detect_project_type(self, description: str) -> str:
         """Detect project type from description"""
         description_lower = description.lower()
         scores = {}
         
-        for project_type, keywords in self.project_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in description_lower)
-            if score > 0:
-                scores[project_type] = score
+        if self._project_type_automaton is not None:
+            hits = self._keyword_hits(self._project_type_automaton, description_lower)
+            # Pattern order, so ties resolve as in the scan below
+            scores = {project_type: hits[project_type] for project_type in self.project_patterns if project_type in hits}
+        else:
+            for project_type, keywords in self.project_patterns.items():
+                score = sum(1 for keyword in keywords if keyword in description_lower)
+                if score > 0:
+                    scores[project_type] = score
         
         if scores:
             return max(scores, key=lambda k: scores.get(k, 0))
@@ -307,14 +358,15 @@ class AutoSDLCService:
     def _detect_technologies(self, description: str) -> List[str]:
         """Detect technologies mentioned in description"""
         description_lower = description.lower()
-        detected_techs = []
         
-        for category, tech_groups in self.tech_patterns.items():
-            for tech, keywords in tech_groups.items():
-                if any(keyword in description_lower for keyword in keywords):
-                    detected_techs.append(tech)
+        if self._tech_automaton is not None:
+            hits = self._keyword_hits(self._tech_automaton, description_lower)
+            return [tech for tech in self._tech_keywords if tech in hits]
         
-        return detected_techs
+        return [
+            tech for tech, keywords in self._tech_keywords.items()
+            if any(keyword in description_lower for keyword in keywords)
+        ]
     
     def _extract_features(self, description: str) -> List[str]:
         """Extract key features from description"""
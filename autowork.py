@@ -1,22 +1,40 @@
 import asyncio
+import time
 import aiohttp
-from typing import List, Dict, Optional  # This line should be there
+from typing import List, Dict, Optional, Tuple  # This line should be there
 from datetime import datetime, timedelta
 import random
 import json
 from rich.console import Console
 from rich.table import Table
 from sqlalchemy import select, and_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
-from database import Project, Bid, init_db
+from database import Project, Bid, init_db, summary_counts_query
 from rate_limiter import RateLimiter
 from utils import log_info, log_error, log_success
 
 console = Console()
 
+# orjson parses API responses several times faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
 class AutoWork:
+    # Projects whose skill-name lists are kept; the oldest are dropped first
+    SKILL_NAMES_CACHE_SIZE = 1000
+    
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
         self.db_engine = None
@@ -26,18 +44,42 @@ class AutoWork:
             settings.api_rate_limit_per_hour,
             settings.api_rate_limit_per_day
         )
+        # Lowercased once; every project is matched against these
+        self.priority_skills = [(skill, skill.lower()) for skill in settings.priority_skills]
+        self.our_skills = frozenset(lower for _, lower in self.priority_skills)
+        # Skill-name list per project id, so the API dicts stored as raw_data stay untouched
+        self._skill_names: Dict[int, List[str]] = {}
         self.base_url = "https://www.freelancer.com/api"
+        # Search parameters shared by every query, built once; aiohttp wants
+        # string values, and countries[] repeats once per country
+        self.search_params = [
+            ("offset", 0),
+            ("job_details", "true"),
+            ("user_details", "true"),
+            ("full_description", "true"),
+            ("user_reputation", "true"),
+            *[("countries[]", country) for country in settings.target_countries],
+            ("min_avg_price", settings.min_project_budget),
+            ("sort_field", "time_submitted"),
+            ("compact", "true"),
+        ]
         self.headers = {
             "Freelancer-OAuth-V1": settings.freelancer_oauth_token
         }
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # Skill searches and bids run concurrently; cap the connections they
+        # share and keep resolved API addresses for the session
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
         self.db_engine, self.db_session = await init_db(settings.database_url)
         await self.rate_limiter.load_tracking()
         return self
         
     async def __aexit__(self, *args):
+        await self.rate_limiter.close()
         if self.session:
             await self.session.close()
         if self.db_engine:
@@ -45,28 +87,14 @@ class AutoWork:
     
     async def fetch_projects(self, query: str, limit: int = 100) -> List[Dict]:
         """Fetch projects for a specific query"""
-        can_request, reason = await self.rate_limiter.can_make_request()
+        can_request, reason = await self.rate_limiter.acquire()
         if not can_request:
             log_error(f"Rate limited: {reason}")
             return []
         
-        params = {
-            "query": query,
-            "limit": limit,
-            "offset": 0,
-            "job_details": True,
-            "user_details": True,
-            "full_description": True,
-            "user_reputation": True,
-            "countries[]": settings.target_countries,
-            "min_avg_price": settings.min_project_budget,
-            "sort_field": "time_submitted",
-            "compact": True
-        }
+        params = [("query", query), ("limit", limit), *self.search_params]
         
         try:
-            await self.rate_limiter.record_request()
-            
             async with self.session.get(
                 f"{self.base_url}/projects/0.1/projects/active/",
                 headers=self.headers,
@@ -81,7 +109,7 @@ class AutoWork:
                     log_error(f"API error: {response.status}")
                     return []
                 
-                data = await response.json()
+                data = _json_loads(await response.read())
                 projects = data.get("result", {}).get("projects", [])
                 
                 log_success(f"Fetched {len(projects)} projects for '{query}'")
@@ -96,38 +124,31 @@ class AutoWork:
         all_projects = []
         seen_ids = set()
         
-        # Create tasks for concurrent fetching
-        tasks = []
-        for skill in settings.priority_skills:
-            task = self.fetch_projects(skill)
-            tasks.append(task)
-            
-            # Batch requests to avoid overwhelming the API
-            if len(tasks) >= 5:
-                results = await asyncio.gather(*tasks)
-                for projects in results:
-                    for project in projects:
-                        if project["id"] not in seen_ids:
-                            all_projects.append(project)
-                            seen_ids.add(project["id"])
-                
-                tasks = []
-                await asyncio.sleep(2)  # Delay between batches
-        
-        # Process remaining tasks
-        if tasks:
-            results = await asyncio.gather(*tasks)
-            for projects in results:
-                for project in projects:
-                    if project["id"] not in seen_ids:
-                        all_projects.append(project)
-                        seen_ids.add(project["id"])
+        # Fetch every skill concurrently - the rate limiter spaces the requests
+        results = await asyncio.gather(
+            *[self.fetch_projects(skill) for skill in settings.priority_skills]
+        )
+        for projects in results:
+            for project in projects:
+                if project["id"] not in seen_ids:
+                    all_projects.append(project)
+                    seen_ids.add(project["id"])
         
         return all_projects
     
+    def skill_names(self, project: Dict) -> List[str]:
+        """Names of the project's skills, built on first use per project id"""
+        names = self._skill_names.get(project["id"])
+        if names is None:
+            names = self._skill_names[project["id"]] = [job["name"] for job in project.get("jobs", [])]
+            if len(self._skill_names) > self.SKILL_NAMES_CACHE_SIZE:
+                # Dicts keep insertion order - drop the oldest entry
+                del self._skill_names[next(iter(self._skill_names))]
+        return names
+    
     def is_elite_project(self, project: Dict) -> bool:
         """Determine if a project is elite"""
-        budget_min = project.get("budget", {}).get("minimum", 0)
+        budget_min = (project.get("budget") or {}).get("minimum", 0)
         
         # Elite criteria
         if budget_min >= 500:
@@ -144,7 +165,7 @@ class AutoWork:
     def should_bid_on_project(self, project: Dict) -> bool:
         """Determine if we should bid on this project"""
         # Check budget
-        budget_min = project.get("budget", {}).get("minimum", 0)
+        budget_min = (project.get("budget") or {}).get("minimum", 0)
         if budget_min < settings.min_project_budget:
             return False
         
@@ -153,64 +174,91 @@ class AutoWork:
         if bid_count > settings.max_existing_bids:
             return False
         
-        # Check age
-        time_submitted = project.get("time_submitted", 0)
-        project_age = datetime.now() - datetime.fromtimestamp(time_submitted)
-        if project_age > timedelta(hours=24):
+        # Check age (time_submitted is epoch seconds)
+        if time.time() - project.get("time_submitted", 0) > 24 * 3600:
             return False
         
         # Check skills match
-        project_skills = [job["name"].lower() for job in project.get("jobs", [])]
-        our_skills = [skill.lower() for skill in settings.priority_skills]
-        
-        matching_skills = set(project_skills) & set(our_skills)
-        return len(matching_skills) > 0
+        project_skills = {name.lower() for name in self.skill_names(project)}
+        return not self.our_skills.isdisjoint(project_skills)
     
     async def save_project(self, project: Dict, search_keyword: str):
         """Save project to database"""
-        async with self.db_session() as session:
-            # Check if project already exists
-            existing = await session.execute(
-                select(Project).where(Project.project_id == project["id"])
+        await self.save_projects([(project, search_keyword)])
+    
+    async def save_projects(self, projects: List[Tuple[Dict, str]], session: Optional[AsyncSession] = None):
+        """Save (project, search_keyword) pairs to database in one transaction
+        
+        Given a session, the rows join the caller's transaction uncommitted.
+        """
+        if not projects:
+            return
+        
+        if session is None:
+            async with self.db_session() as session:
+                await self.save_projects(projects, session)
+                await session.commit()
+            return
+        
+        rows = [self._project_values(project, search_keyword) for project, search_keyword in projects]
+        
+        # Let the unique project_id index skip projects already stored
+        insert = UPSERT_INSERTS.get(self.db_engine.dialect.name)
+        if insert is not None:
+            await session.execute(
+                insert(Project).on_conflict_do_nothing(index_elements=[Project.project_id]),
+                rows
             )
-            if existing.scalar_one_or_none():
-                return
-            
-            # Create new project record
-            db_project = Project(
-                project_id=project["id"],
-                title=project.get("title", ""),
-                description=project.get("description", ""),
-                budget_min=project.get("budget", {}).get("minimum", 0),
-                budget_max=project.get("budget", {}).get("maximum", 0),
-                currency=project.get("currency", {}).get("code", "USD"),
-                bid_count=project.get("bid_stats", {}).get("bid_count", 0),
-                skills=[job["name"] for job in project.get("jobs", [])],
-                country=project.get("location", {}).get("country", {}).get("name", ""),
-                search_keyword=search_keyword,
-                is_elite=self.is_elite_project(project),
-                time_submitted=datetime.fromtimestamp(project.get("time_submitted", 0)),
-                raw_data=project
+            return
+        
+        # Other backends: one lookup for every id, then add the new ones
+        existing = await session.execute(
+            select(Project.project_id).where(
+                Project.project_id.in_([row["project_id"] for row in rows])
             )
-            
-            session.add(db_project)
-            await session.commit()
+        )
+        seen_ids = set(existing.scalars().all())
+        
+        for row in rows:
+            if row["project_id"] in seen_ids:
+                continue
+            seen_ids.add(row["project_id"])
+            session.add(Project(**row))
+    
+    def _project_values(self, project: Dict, search_keyword: str) -> Dict:
+        """Column values of the Project row for an API project"""
+        budget = project.get("budget") or {}
+        return dict(
+            project_id=project["id"],
+            title=project.get("title", ""),
+            description=project.get("description", ""),
+            budget_min=budget.get("minimum", 0),
+            budget_max=budget.get("maximum", 0),
+            currency=project.get("currency", {}).get("code", "USD"),
+            bid_count=project.get("bid_stats", {}).get("bid_count", 0),
+            skills=self.skill_names(project),
+            country=project.get("location", {}).get("country", {}).get("name", ""),
+            search_keyword=search_keyword,
+            is_elite=self.is_elite_project(project),
+            time_submitted=datetime.fromtimestamp(project.get("time_submitted", 0)),
+            raw_data=project
+        )
     
     def calculate_bid_amount(self, project: Dict) -> float:
         """Calculate appropriate bid amount - always bid at minimum budget in original currency"""
-        budget_min = project.get("budget", {}).get("minimum", 0)
+        budget_min = (project.get("budget") or {}).get("minimum", 0)
         currency_code = project.get("currency", {}).get("code", "USD")
         
         # Always bid at the minimum budget amount in the original currency
         # No currency conversion - bid in the same currency as the project
         return budget_min
     
-    def generate_bid_description(self, project: Dict) -> str:
-        """Generate bid description"""
-        skills = [job["name"] for job in project.get("jobs", [])][:3]
-        skills_text = ", ".join(skills)
+    def generate_bid_description(self, project: Dict, delivery_days: Optional[int] = None) -> str:
+        """Generate bid description (pass delivery_days when already estimated)"""
+        skills_text = ", ".join(self.skill_names(project)[:3])
         project_title = project.get("title", "your project")
-        delivery_days = self.estimate_project_duration(project)
+        if delivery_days is None:
+            delivery_days = self.estimate_project_duration(project)
         
         template = random.choice(settings.bid_templates)
         return template.format(
@@ -221,7 +269,7 @@ class AutoWork:
     
     def estimate_project_duration(self, project: Dict) -> int:
         """Estimate project duration in days"""
-        budget = project.get("budget", {}).get("minimum", 0)
+        budget = (project.get("budget") or {}).get("minimum", 0)
         
         if budget < 100:
             return 3
@@ -234,45 +282,53 @@ class AutoWork:
         else:
             return 14
     
-    async def place_bid(self, project: Dict) -> Dict:
-        """Place a bid on a project"""
-        can_request, reason = await self.rate_limiter.can_make_request()
+    async def place_bid(self, project: Dict, session: Optional[AsyncSession] = None) -> Dict:
+        """Place a bid on a project
+        
+        Given a session, the bid record joins the caller's transaction
+        instead of being committed on its own.
+        """
+        # Concurrent bids are spaced by the limiter, which also records the request
+        can_request, reason = await self.rate_limiter.acquire()
         if not can_request:
             return {"success": False, "error": f"Rate limited: {reason}"}
         
+        # Estimated once - the period and the description's days must agree
+        delivery_days = self.estimate_project_duration(project)
         bid_data = {
             "project_id": project["id"],
             "bidder_id": settings.freelancer_user_id,
             "amount": self.calculate_bid_amount(project),
-            "period": self.estimate_project_duration(project),
+            "period": delivery_days,
             "milestone_percentage": 100,
-            "description": self.generate_bid_description(project)
+            "description": self.generate_bid_description(project, delivery_days)
         }
         
         try:
-            await self.rate_limiter.record_request()
-            
             async with self.session.post(
                 f"{self.base_url}/projects/0.1/bids/",
                 headers={**self.headers, "Content-Type": "application/json"},
                 json=bid_data
             ) as response:
                 
-                response_data = await response.json()
+                response_data = _json_loads(await response.read())
                 
                 # Save bid record
-                async with self.db_session() as session:
-                    db_bid = Bid(
-                        project_id=project["id"],
-                        bid_id=response_data.get("result", {}).get("id"),
-                        amount=bid_data["amount"],
-                        period=bid_data["period"],
-                        description=bid_data["description"],
-                        status="success" if response.status in [200, 201] else "failed",
-                        response_data=response_data
-                    )
+                db_bid = Bid(
+                    project_id=project["id"],
+                    bid_id=response_data.get("result", {}).get("id"),
+                    amount=bid_data["amount"],
+                    period=bid_data["period"],
+                    description=bid_data["description"],
+                    status="success" if response.status in [200, 201] else "failed",
+                    response_data=response_data
+                )
+                if session is not None:
                     session.add(db_bid)
-                    await session.commit()
+                else:
+                    async with self.db_session() as bid_session:
+                        bid_session.add(db_bid)
+                        await bid_session.commit()
                 
                 if response.status in [200, 201]:
                     log_success(f"✓ Bid placed on: {project['title']}")
@@ -285,25 +341,39 @@ class AutoWork:
             log_error(f"Error placing bid: {e}")
             return {"success": False, "error": str(e)}
     
+    async def _keep_placed_bids(self, session: AsyncSession):
+        """Commit the bid records added so far when a batch stops on an error
+        
+        If the session itself failed (e.g. a flush error) it is rolled back
+        instead. Errors here are logged so the caller re-raises the original.
+        """
+        try:
+            if session.is_active:
+                await session.commit()
+            else:
+                await session.rollback()
+        except Exception as e:
+            log_error(f"Could not save bid records: {e}")
+    
     async def get_unbid_projects(self, limit: int = 10) -> List[Dict]:
         """Get projects we haven't bid on yet"""
         async with self.db_session() as session:
-            # Get projects without bids
+            # Get projects without bids - only the raw_data column, so no
+            # Project objects are built for rows that are used once
             result = await session.execute(
-                select(Project)
+                select(Project.raw_data)
                 .outerjoin(Bid, Project.project_id == Bid.project_id)
                 .where(
                     and_(
                         Bid.id.is_(None),
-                        Project.created_at > datetime.now() - timedelta(hours=24)
+                        Project.created_at > datetime.utcnow() - timedelta(hours=24)
                     )
                 )
                 .order_by(Project.is_elite.desc(), Project.created_at.desc())
                 .limit(limit)
             )
             
-            projects = result.scalars().all()
-            return [p.raw_data for p in projects]
+            return list(result.scalars())
     
     async def process_batch_fetch(self):
         """Fetch and store projects in batch mode"""
@@ -311,13 +381,15 @@ class AutoWork:
         
         projects = await self.fetch_all_projects()
         
-        # Save projects to database
+        # Save projects to database in one transaction
+        to_save = []
         for project in projects:
-            for skill in settings.priority_skills:
-                project_skills = [job["name"].lower() for job in project.get("jobs", [])]
-                if skill.lower() in project_skills:
-                    await self.save_project(project, skill)
+            project_skills = {name.lower() for name in self.skill_names(project)}
+            for skill, skill_lower in self.priority_skills:
+                if skill_lower in project_skills:
+                    to_save.append((project, skill))
                     break
+        await self.save_projects(to_save)
         
         log_success(f"Batch fetch complete. Processed {len(projects)} projects.")
         
@@ -340,45 +412,33 @@ class AutoWork:
         
         log_info(f"Found {len(eligible_projects)} eligible projects to bid on.")
         
-        # Place bids
+        # Place bids - every bid record commits in one transaction
         success_count = 0
-        for project in eligible_projects:
-            result = await self.place_bid(project)
-            if result["success"]:
-                success_count += 1
+        async with self.db_session() as session:
+            try:
+                for project in eligible_projects:
+                    result = await self.place_bid(project, session)
+                    if result["success"]:
+                        success_count += 1
+                    
+                    # Small delay between bids
+                    await asyncio.sleep(2)
+            except Exception:
+                await self._keep_placed_bids(session)
+                raise
             
-            # Small delay between bids
-            await asyncio.sleep(2)
+            await session.commit()
         
         log_success(f"Batch bid complete. Successfully bid on {success_count} projects.")
     
     async def show_summary(self):
         """Show current system summary"""
         async with self.db_session() as session:
-            # Get counts
-            total_projects = await session.execute(
-                select(Project).count()
-            )
-            total_count = total_projects.scalar()
-            
-            today_projects = await session.execute(
-                select(Project)
-                .where(Project.created_at > datetime.now() - timedelta(days=1))
-                .count()
-            )
-            today_count = today_projects.scalar()
-            
-            total_bids = await session.execute(
-                select(Bid).count()
-            )
-            bid_count = total_bids.scalar()
-            
-            successful_bids = await session.execute(
-                select(Bid)
-                .where(Bid.status == "success")
-                .count()
+            # Get counts in one round trip
+            result = await session.execute(
+                summary_counts_query(datetime.utcnow() - timedelta(days=1))
             )
-            success_count = successful_bids.scalar()
+            total_count, today_count, bid_count, success_count = result.one()
         
         # Create summary table
         table = Table(title="AutoWork Summary")
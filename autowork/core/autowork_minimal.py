@@ -8,25 +8,163 @@ import os
 import sys
 import json
 import time
+import random
+import hashlib
 import logging
+import logging.handlers
+import threading
 import requests
-import redis
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait as wait_futures
+from collections import deque
+from itertools import cycle, islice
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from spam_filter import SpamFilter
 from currency_converter_freelancer import CurrencyConverter
 from contest_handler import ContestHandler
 
+# orjson encodes/decodes several times faster than stdlib json; its dumps
+# returns bytes, which Redis and requests accept as-is
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# ijson (optional) parses the project listing straight off the socket so the
+# raw body and the decoded dict are never held in memory together
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Prebuilt bid data (scripts/build_data.py) - importing marshalled constants
+# skips json parsing at startup; the JSON files win whenever they are newer
+try:
+    import _bid_data
+except ImportError:
+    _bid_data = None
+
+def _bid_data_fresh(filename: str) -> bool:
+    """Whether _bid_data was built from the current copy of filename"""
+    if _bid_data is None:
+        return False
+    try:
+        return os.path.getmtime(filename) <= _bid_data.SOURCE_MTIMES.get(filename, -1)
+    except OSError:
+        return True
+
+class _TemplateFields(dict):
+    """format_map() fields - placeholders with no value render as empty"""
+    def __missing__(self, key):
+        return ''
+
+def _usable_template(template: str) -> bool:
+    """Whether a bid template's braces parse as format placeholders"""
+    try:
+        template.format_map(_TemplateFields())
+        return True
+    except (ValueError, IndexError, AttributeError):
+        return False
+
+def _body_preview(response, limit: int = 200) -> str:
+    """First `limit` bytes of an error body - no charset sniffing or full decode
+
+    Streamed responses only read those bytes off the socket.
+    """
+    return next(response.iter_content(limit), b'').decode('utf-8', 'replace')
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def _buffer_log_output(capacity: int) -> Optional[logging.handlers.MemoryHandler]:
+    """Buffer the root handler's output, written out by flush() or any warning
+    
+    Only a single plain root handler is wrapped; any other logging setup is
+    left alone and None is returned.
+    """
+    root = logging.getLogger()
+    if len(root.handlers) != 1 or isinstance(root.handlers[0], logging.handlers.MemoryHandler):
+        return None
+    target = root.handlers[0]
+    buffer = logging.handlers.MemoryHandler(capacity, flushLevel=logging.WARNING, target=target)
+    root.removeHandler(target)
+    root.addHandler(buffer)
+    return buffer
+
 class AutoWorkMinimal:
+    # Minimum budget and display prefix for currencies checked natively;
+    # anything else is converted to USD and held to the $100 minimum
+    MIN_BUDGET_BY_CURRENCY = {
+        'USD': (100.0, '$'),
+        'INR': (12000.0, '₹'),
+        'PKR': (12000.0, 'PKR '),
+    }
+    
+    # Processed project ids live in a sorted set scored by time processed, so
+    # each save only ZADDs the new ids and the oldest fall off past the cap
+    PROCESSED_PROJECTS_KEY = 'processed_projects_zset'
+    PROCESSED_PROJECTS_CAP = 1000
+    
+    # The in-memory copy forgets its oldest ids past this size; anything that
+    # old has long dropped out of the newest-first active listing
+    PROCESSED_PROJECTS_LOCAL_CAP = 10000
+    
+    # Signed NDA/IP agreements are kept the same way, newest SIGNED_PROJECTS_CAP
+    # per key; an older project is long closed and would only be re-checked
+    NDA_SIGNED_KEY = 'nda_signed_projects_zset'
+    IP_SIGNED_KEY = 'ip_signed_projects_zset'
+    SIGNED_PROJECTS_CAP = 1000
+    
+    # Most successful bids placed in one monitoring cycle
+    BIDS_PER_CYCLE = 3
+    
+    # Approved projects left unbid (cycle cap reached or bid failed) are
+    # retried next cycle, up to this many - the from_time listing won't
+    # return them again. A project whose bid fails CARRY_OVER_ATTEMPTS times
+    # is marked processed and dropped
+    CARRY_OVER_MAX = 50
+    CARRY_OVER_ATTEMPTS = 3
+    
+    # Adaptive polling: the scheduled interval is scaled down after cycles that
+    # found new projects and up after empty ones, within these bounds
+    POLL_SCALE_MIN = 0.5
+    POLL_SCALE_MAX = 2.0
+    
+    # Log records held while monitoring; written before every wait, or sooner
+    # when this many pile up or a warning is logged
+    LOG_BUFFER_CAPACITY = 256
+    
+    # While state is unchanged only last_update is refreshed, this often
+    SAVE_STATE_INTERVAL = 300
+    
+    # Phrases that mark a description as stating clear requirements
+    REQUIREMENTS_KEYWORDS = ('requirements', 'need', 'must have', 'looking for', 'deliverables', 'want', 'project')
+    
+    # Upgrades that make a project elite (NDA/IP are handled separately)
+    ELITE_UPGRADES = ('featured', 'qualified')
+    
+    # Fixed query for the active project listing, encoded once into the
+    # endpoint URL; limit/from_time vary per poll and are passed as params
+    PROJECTS_PARAMS = {
+        'job_details': 'true',
+        # Newest first, so fresh postings are bid on before the cycle cap
+        'sort_field': 'time_submitted'
+    }
+
     def __init__(self):
         self.token = self.load_token()
         # Convert user_id to integer to fix bid placement error
         user_id_str = os.environ.get('FREELANCER_USER_ID', '45214417')
         self.user_id = int(user_id_str)
         self.api_base = "https://www.freelancer.com/api"
+        self._projects_endpoint = f"{self.api_base}/projects/0.1/projects/active?{urlencode(self.PROJECTS_PARAMS)}"
+        self._bids_endpoint = f"{self.api_base}/projects/0.1/bids/"
         self.headers = {
             "Freelancer-OAuth-V1": self.token,
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -34,14 +172,60 @@ class AutoWorkMinimal:
             "Content-Type": "application/json"
         }
         
-        # Initialize Redis connection
-        self.redis_client = self.init_redis()
+        # Shared HTTP session - every API call reuses pooled keep-alive
+        # connections instead of a TLS handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Retries only cover idempotent methods by default, so a bid POST is
+        # never re-sent; place_bid still handles its own 429 back-off.
+        # Every call goes to one host; the pool holds a keep-alive connection
+        # for each concurrent request - the project listing plus the parallel
+        # NDA/IP checks of every in-flight bid - so none is dropped and redialled
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2 * self.BIDS_PER_CYCLE + 1,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.request_timeout = 15
+        
+        # Connect to Redis in the background while configs, filters and currency
+        # rates load - the connect/ping round trip and the currency refresh
+        # overlap; the client is resolved before state is read from it
+        startup_pool = ThreadPoolExecutor(max_workers=1)
+        redis_future = startup_pool.submit(self.init_redis)
         
         # Load configurations
         self.bid_messages = self.load_bid_messages()
         self.skills_map = self.load_skills_map()
         self.config = self.load_config()
         
+        # Per-instance RNG for jitter and the message rotation order
+        self._rng = random.Random()
+        
+        # Professional templates, checked once so a stray brace can't fail a bid
+        self._template_days = str(self.config['bidding']['delivery_days'])
+        self._bid_templates = tuple(message for message in self.bid_messages.get('professional', ())
+                                    if _usable_template(message))
+        # Rotate through one shuffled order - every template gets used evenly and
+        # picking one is a plain next() instead of an RNG call per bid
+        self._template_cycle = cycle(self._rng.sample(self._bid_templates, len(self._bid_templates)))
+        
+        # Bid message per project, so a retried bid reuses the same text
+        self._message_cache = {}
+        self._message_cache_size = 1000
+        # Bids run on pool threads; the cache and the template rotation are shared
+        self._message_lock = threading.Lock()
+        
+        # Approved projects are bid on from a small pool so one bid's NDA/IP
+        # round trips overlap the previous bid's pacing wait; _bid_lock keeps
+        # the pacing and the POST itself strictly one at a time
+        self._bid_lock = threading.Lock()
+        self._bid_pool = ThreadPoolExecutor(max_workers=self.BIDS_PER_CYCLE)
+        self._poll_scale = 1.0
+        self._log_buffer = None  # set while realtime monitoring runs
+        
         # Initialize spam filter - ENABLED for quality filtering
         try:
             self.spam_filter = SpamFilter()
@@ -54,7 +238,7 @@ class AutoWorkMinimal:
         
         # Initialize currency converter
         try:
-            self.currency_converter = CurrencyConverter(freelancer_token=self.token)
+            self.currency_converter = CurrencyConverter(freelancer_token=self.token, session=self.session)
             logging.info("✓ Currency converter initialized")
         except Exception as e:
             logging.warning(f"Currency converter initialization failed: {e}")
@@ -75,7 +259,7 @@ class AutoWorkMinimal:
         self.contests_enabled = self.config.get('contests', {}).get('enabled', False)
         if self.contests_enabled:
             try:
-                self.contest_handler = ContestHandler(self.token, self.user_id)
+                self.contest_handler = ContestHandler(self.token, self.user_id, self.session)
                 logging.info("✓ Contest handler initialized")
             except Exception as e:
                 logging.warning(f"Contest handler initialization failed: {e}")
@@ -86,15 +270,32 @@ class AutoWorkMinimal:
         
         # Enhanced tracking
         self.processed_projects = set()
+        self._processed_order = deque()  # same ids, oldest first, for eviction
+        self._processed_total = 0  # ids ever remembered, for change detection
+        self._processed_pending = set()  # ids not yet written to Redis
+        self._recent_bids_pending = []  # dashboard bid records, same
+        self._legacy_processed_blob = False
+        self._saved_state_signature = None
+        self._last_state_save_mono = 0.0
         self.bid_count = 0
         self.bids_today = 0
         self.wins_count = 0
         self.elite_bid_count = 0
         self.nda_signed_projects = set()
         self.ip_signed_projects = set()
-        self.last_bid_time = 0
+        self.last_bid_time = None  # time.monotonic() of the last bid
+        self._bid_tokens = 0.0  # bucket level right after that bid
+        self._bids_paused_until = 0.0  # time.monotonic() the API's Retry-After ends
         self.start_time = datetime.now()
-        self.today_date = datetime.now().date()
+        
+        # Conditional-GET state for the active project listing
+        self._projects_etag = None
+        self._projects_digest = None
+        self._projects_cache = []
+        self._projects_from_time = None  # newest time_submitted seen so far
+        self._carry_over_projects = {}  # project id -> (approved project not yet bid on, failed bids)
+        self.today_date = self.start_time.date()
+        self._next_day_epoch = self.next_midnight_epoch(self.today_date)
         
         # Filtering statistics
         self.filtered_projects_count = 0
@@ -135,10 +336,17 @@ class AutoWorkMinimal:
             'premium': 0
         }
         
-        # Portfolio specializations
+        # Portfolio specializations, and their skills lowercased once for matching
         self.specializations = self.load_specializations()
+        self._our_skills = frozenset(
+            skill.lower()
+            for skills in self.specializations.values() if isinstance(skills, list)
+            for skill in skills
+        )
         
         # Load state from Redis
+        self.redis_client = redis_future.result()
+        startup_pool.shutdown(wait=False)
         self.load_state_from_redis()
         
         logging.info("✓ Enhanced Bot initialized with ULTRA SIMPLE FILTERING")
@@ -159,8 +367,8 @@ class AutoWorkMinimal:
         
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+                with open(config_file, 'rb') as f:
+                    config = _json_loads(f.read())
                     logging.info("✓ Loaded configuration from bot_config.json")
                     return config
             except Exception as e:
@@ -172,6 +380,7 @@ class AutoWorkMinimal:
                 "delivery_days": 3,
                 "express_delivery_days": 2,
                 "min_bid_delay_seconds": 60,  # Increased from 10 to 60 seconds
+                "bid_burst": 1,  # Bids that may go out back-to-back before pacing applies
                 "bid_multiplier_regular": 1.15,
                 "bid_multiplier_elite": 1.25,
                 "default_bid_regular": 150,
@@ -218,7 +427,8 @@ class AutoWorkMinimal:
                 "portfolio_matching": False,  # Disabled - bid on any project
                 "min_skill_match_score": 0.0,  # No skill match requirement
                 "min_description_length": 0,  # No description length requirement
-                "prefer_long_term": False  # No preference
+                "prefer_long_term": False,  # No preference
+                "full_description": False  # Preview text is enough - bids use templates
             },
             "quality_filters": {
                 "enabled": False,  # DISABLED - no quality filtering
@@ -270,32 +480,20 @@ class AutoWorkMinimal:
                 min_budget = float(budget.get('minimum', 0))
                 currency_code = project.get('currency', {}).get('code', 'USD')
                 
-                # Check minimum budget based on currency
-                if currency_code == 'USD':
-                    min_required = 100.0  # $100 minimum
+                # Check minimum budget based on currency - one table lookup
+                threshold = self.MIN_BUDGET_BY_CURRENCY.get(currency_code)
+                if threshold is not None:
+                    min_required, symbol = threshold
                     if min_budget < min_required:
                         self.skipped_projects['low_budget'] += 1
-                        return False, f"Budget too low (${min_budget} < ${min_required})"
-                elif currency_code == 'INR':
-                    min_required = 12000.0  # ₹12000 minimum
-                    if min_budget < min_required:
-                        self.skipped_projects['low_budget'] += 1
-                        return False, f"Budget too low (₹{min_budget} < ₹{min_required})"
-                elif currency_code == 'PKR':
-                    min_required = 12000.0  # PKR 12000 minimum
-                    if min_budget < min_required:
-                        self.skipped_projects['low_budget'] += 1
-                        return False, f"Budget too low (PKR {min_budget} < PKR {min_required})"
-                else:
+                        return False, f"Budget too low ({symbol}{min_budget} < {symbol}{min_required})"
+                elif self.currency_converter:
                     # For other currencies, convert to USD and check
-                    if self.currency_converter:
-                        min_usd = self.currency_converter.to_usd(min_budget, currency_code)
-                        if min_usd < 100.0:
-                            self.skipped_projects['low_budget'] += 1
-                            return False, f"Budget too low (${min_usd:.2f} < $100.00)"
-                    else:
-                        # If no converter, allow the project
-                        pass
+                    min_usd = self.currency_converter.to_usd(min_budget, currency_code)
+                    if min_usd < 100.0:
+                        self.skipped_projects['low_budget'] += 1
+                        return False, f"Budget too low (${min_usd:.2f} < $100.00)"
+                # If no converter, allow the project
             else:
                 self.skipped_projects['invalid_data'] += 1
                 return False, "No budget information"
@@ -313,7 +511,7 @@ class AutoWorkMinimal:
         score = 0
         
         # Description quality (30 points) - More lenient
-        description = project.get('description', '')
+        description = project.get('description') or project.get('preview_description', '')
         word_count = len(description.split())
         if word_count >= 100:
             score += 30
@@ -325,8 +523,8 @@ class AutoWorkMinimal:
             score += 10
         
         # Has clear requirements (20 points) - More lenient
-        requirements_keywords = ['requirements', 'need', 'must have', 'looking for', 'deliverables', 'want', 'project']
-        if any(keyword in description.lower() for keyword in requirements_keywords):
+        description_lower = description.lower()
+        if any(keyword in description_lower for keyword in self.REQUIREMENTS_KEYWORDS):
             score += 20
         elif word_count > 0:  # Give points for any description
             score += 10
@@ -522,11 +720,15 @@ class AutoWorkMinimal:
     def realtime_monitor_with_bidding(self):
         """Monitor and bid on projects with ultra simple filtering - only budget requirements"""
         logging.info("🚀 Starting Enhanced AutoWork Bot - ULTRA SIMPLE FILTERING MODE...")
-        logging.info(f"User ID: {self.user_id}")
-        logging.info(f"Filtering Mode: ULTRA SIMPLE - Only budget requirements")
-        logging.info(f"Minimum Budget: $100 USD / ₹12000 INR / PKR 12000")
-        logging.info(f"No other filters applied")
-        logging.info(f"Smart Features: Enabled")
+        logging.info("User ID: %s", self.user_id)
+        logging.info("Filtering Mode: ULTRA SIMPLE - Only budget requirements")
+        logging.info("Minimum Budget: $100 USD / ₹12000 INR / PKR 12000")
+        logging.info("No other filters applied")
+        logging.info("Smart Features: Enabled")
+        
+        # A cycle's log lines are written together, before it sleeps
+        if self._log_buffer is None:
+            self._log_buffer = _buffer_log_output(self.LOG_BUFFER_CAPACITY)
         
         error_count = 0
         max_errors = self.config['monitoring']['max_consecutive_errors']
@@ -534,93 +736,138 @@ class AutoWorkMinimal:
         
         # Update Redis status
         if self.redis_client:
-            self.redis_client.set('bot_status', 'Running - Ultra Simple Filtering Mode')
-            self.redis_client.set('bot_start_time', self.start_time.isoformat())
+            self.redis_client.mset({
+                'bot_status': 'Running - Ultra Simple Filtering Mode',
+                'bot_start_time': self.start_time.isoformat()
+            })
         
         while True:
             try:
                 cycle_count += 1
+                cycle_hour = datetime.now().hour  # one clock read serves the whole cycle
                 
                 # Check daily limit
                 if self.bids_today >= self.config['monitoring']['daily_bid_limit']:
-                    logging.warning(f"Daily bid limit reached ({self.config['monitoring']['daily_bid_limit']})")
-                    hours_until_midnight = (24 - datetime.now().hour)
-                    logging.info(f"Waiting {hours_until_midnight} hours until midnight...")
+                    logging.warning("Daily bid limit reached (%s)", self.config['monitoring']['daily_bid_limit'])
+                    hours_until_midnight = (24 - cycle_hour)
+                    logging.info("Waiting %s hours until midnight...", hours_until_midnight)
+                    self.flush_logs()
                     time.sleep(hours_until_midnight * 3600)
                     continue
                 
                 # Fetch and process projects
                 projects = self.get_active_projects(limit=self.config['filtering']['max_projects_per_cycle'])
                 
+                # Success/backoff follows the fetch alone; carried projects only join a good one
                 if projects:
-                    logging.info(f"\n🔄 Cycle {cycle_count}: Analyzing {len(projects)} projects for budget requirements")
+                    # Retry approved projects the listing has already moved past
+                    if self._carry_over_projects:
+                        fetched_ids = {int(project["id"]) for project in projects}
+                        projects = projects + [project for project_id, (project, _) in self._carry_over_projects.items()
+                                               if project_id not in fetched_ids]
+                    
+                    logging.info("\n🔄 Cycle %s: Analyzing %s projects for budget requirements", cycle_count, len(projects))
                     
                     new_bids = 0
                     projects_analyzed = 0
+                    carried_analyzed = 0
+                    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
                     budget_approved_projects = 0
                     
-                    # Process each project
+                    # Filter every project first, then bid on the approved ones
+                    approved = []
                     for project in projects:
-                        project_id = project.get("id")
+                        # Ids are always tracked as ints so membership never misses on '123' vs 123
+                        project_id = int(project["id"])
                         
                         # Skip if already processed
                         if project_id in self.processed_projects:
                             continue
                         
                         projects_analyzed += 1
+                        carried_analyzed += project_id in self._carry_over_projects
                         self.filtered_projects_count += 1
                         
                         # Check if should bid (ultra simple filtering)
                         should_bid, reason = self.should_bid_on_project(project)
                         
                         if not should_bid:
-                            logging.debug(f"⏭️  Filtered out: {project.get('title', 'Unknown')[:40]}... - {reason}")
-                            self.processed_projects.add(project_id)
+                            if debug_enabled:
+                                logging.debug("⏭️  Filtered out: %s... - %s", project.get('title', 'Unknown')[:40], reason)
+                            self.mark_processed(project_id)
                             continue
                         
                         budget_approved_projects += 1
-                        
-                        # Place bid on approved project
-                        logging.info(f"\n{'='*60}")
-                        logging.info(f"✅ PROJECT APPROVED: {project.get('title', 'Unknown')[:50]}...")
-                        
-                        success = self.place_bid(project)
-                        
-                        if success:
-                            new_bids += 1
-                            
-                            # Use configuration delay instead of smart delay
-                            delay = self.config['bidding']['min_bid_delay_seconds']
-                            
-                            logging.info(f"⏳ Waiting {delay} seconds before next bid...")
-                            time.sleep(delay)
-                        
-                        # Stop if we've bid enough this cycle
-                        if new_bids >= 3:  # Reduced from 5 to 3 bids per cycle
-                            logging.info("📊 Reached cycle bid limit (3 bids)")
-                            break
+                        logging.info("\n" + "=" * 60)
+                        logging.info("✅ PROJECT APPROVED: %s...", project.get('title', 'Unknown')[:50])
+                        approved.append(project)
+                    
+                    # While the API's Retry-After runs, approved projects are only carried over
+                    bid_slots = self.BIDS_PER_CYCLE
+                    if approved and time.monotonic() < self._bids_paused_until:
+                        logging.info("⏸️  Bids paused by API rate limit - carrying over %s approved projects", len(approved))
+                        bid_slots = 0
+                    
+                    # Keep up to the cycle allowance in flight; as soon as a bid
+                    # fails, the next approved project takes its slot
+                    pending = iter(approved)
+                    in_flight = {self._bid_pool.submit(self.place_bid, project)
+                                 for project in islice(pending, bid_slots)}
+                    submitted = len(in_flight)
+                    while in_flight:
+                        done, in_flight = wait_futures(in_flight, return_when=FIRST_COMPLETED)
+                        new_bids += sum(future.result() for future in done)
+                        room = self.BIDS_PER_CYCLE - new_bids - len(in_flight)
+                        more = {self._bid_pool.submit(self.place_bid, project)
+                                for project in islice(pending, max(0, room))}
+                        submitted += len(more)
+                        in_flight |= more
+                    
+                    if new_bids >= self.BIDS_PER_CYCLE:
+                        logging.info("📊 Reached cycle bid limit (%s bids)", self.BIDS_PER_CYCLE)
+                    
+                    # Never submitted or failed without being marked processed; the
+                    # first `submitted` approved projects were tried this cycle
+                    carry_over = {}
+                    for index, project in enumerate(approved):
+                        project_id = int(project["id"])
+                        if project_id in self.processed_projects:
+                            continue
+                        _, failures = self._carry_over_projects.get(project_id, (None, 0))
+                        failures += index < submitted
+                        if failures >= self.CARRY_OVER_ATTEMPTS:
+                            logging.info("Giving up on project %s after %s failed bids", project_id, failures)
+                            self.mark_processed(project_id)
+                        elif len(carry_over) < self.CARRY_OVER_MAX:
+                            carry_over[project_id] = (project, failures)
+                    self._carry_over_projects = carry_over
                     
                     # Log cycle summary
                     if projects_analyzed > 0:
                         approval_rate = (budget_approved_projects / projects_analyzed * 100)
-                        logging.info(f"\n📊 Cycle Summary:")
-                        logging.info(f"   Projects analyzed: {projects_analyzed}")
-                        logging.info(f"   Budget approved projects: {budget_approved_projects} ({approval_rate:.1f}%)")
-                        logging.info(f"   Bids placed: {new_bids}")
-                        logging.info(f"   Filtered out: {projects_analyzed - budget_approved_projects}")
+                        logging.info("\n📊 Cycle Summary:")
+                        logging.info("   Projects analyzed: %s", projects_analyzed)
+                        logging.info("   Budget approved projects: %s (%.1f%%)", budget_approved_projects, approval_rate)
+                        logging.info("   Bids placed: %s", new_bids)
+                        logging.info("   Filtered out: %s", projects_analyzed - budget_approved_projects)
                     else:
                         logging.info("No new projects to analyze")
                     
+                    # Poll sooner while new projects keep arriving, back off when quiet
+                    # (retried carry-over projects aren't new arrivals)
+                    if projects_analyzed > carried_analyzed:
+                        self._poll_scale = max(self.POLL_SCALE_MIN, self._poll_scale * 0.7)
+                    else:
+                        self._poll_scale = min(self.POLL_SCALE_MAX, self._poll_scale * 1.4)
+                    
                     error_count = 0  # Reset on success
                     
                 else:
                     error_count += 1
-                    logging.warning(f"No projects fetched (error count: {error_count}/{max_errors})")
+                    logging.warning("No projects fetched (error count: %s/%s)", error_count, max_errors)
                     
                     if error_count >= max_errors:
-                        logging.error(f"Max errors reached. Waiting {self.config['monitoring']['error_retry_delay_seconds']} seconds...")
-                        time.sleep(self.config['monitoring']['error_retry_delay_seconds'])
-                        error_count = 0
+                        logging.error("Max errors reached - backing off (up to %s seconds)", self.config['monitoring']['error_retry_delay_seconds'])
                 
                 # Analyze performance periodically
                 if cycle_count % self.config['performance']['analyze_every_n_cycles'] == 0:
@@ -637,43 +884,43 @@ class AutoWorkMinimal:
                 self.save_state_to_redis()
                 
                 # Determine wait time
-                current_hour = datetime.now().hour
+                current_hour = cycle_hour
                 if 2 <= current_hour <= 6:  # Late night
                     wait_time = self.config['monitoring']['off_hours_interval']
                 elif 8 <= current_hour <= 22:  # Peak hours
                     wait_time = self.config['monitoring']['peak_hours_interval']
                 else:
                     wait_time = self.config['monitoring']['check_interval_seconds']
+                wait_time = self.backoff_delay(wait_time * self._poll_scale, error_count)
                 
                 # Show status
                 if self.bid_count > 0:
                     win_rate = (self.wins_count / self.bid_count * 100)
-                    logging.info(f"\n📈 Status: {self.bid_count} bids | {win_rate:.1f}% wins | {self.passed_filter_count} projects passed filters")
+                    logging.info("\n📈 Status: %s bids | %.1f%% wins | %s projects passed filters", self.bid_count, win_rate, self.passed_filter_count)
                 
-                logging.info(f"💤 Waiting {wait_time} seconds until next cycle...")
+                logging.info("💤 Waiting %.0f seconds until next cycle...", wait_time)
+                self.flush_logs()
                 time.sleep(wait_time)
                 
             except KeyboardInterrupt:
                 logging.info("\n⏹️  Bot stopped by user")
                 self.analyze_performance()
+                self.save_state_to_redis(force=True)
                 if self.redis_client:
                     self.redis_client.set('bot_status', 'Stopped')
                 break
             except Exception as e:
                 error_count += 1
-                logging.error(f"Error in monitoring loop: {e}")
+                logging.error("Error in monitoring loop: %s", e)
                 import traceback
-                logging.error(f"Traceback: {traceback.format_exc()}")
+                logging.error("Traceback: %s", traceback.format_exc())
                 
                 if self.redis_client:
                     self.redis_client.set('last_error', str(e))
                 
                 if error_count >= max_errors:
-                    logging.error(f"Too many errors. Waiting {self.config['monitoring']['error_retry_delay_seconds']} seconds...")
-                    time.sleep(self.config['monitoring']['error_retry_delay_seconds'])
-                    error_count = 0
-                else:
-                    time.sleep(30)
+                    logging.error("Too many errors - backing off (up to %s seconds)", self.config['monitoring']['error_retry_delay_seconds'])
+                time.sleep(self.backoff_delay(30, error_count))
 
     def load_token(self) -> str:
         """Load token from environment or .env file"""
@@ -706,6 +953,9 @@ class AutoWorkMinimal:
     def init_redis(self):
         """Initialize Redis connection"""
         try:
+            # Imported here so the bot still starts (without Redis) if the
+            # client library is missing; the failure is handled below
+            import redis
             redis_url = os.environ.get('REDIS_URL', 'redis://localhost:6379')
             client = redis.from_url(redis_url, decode_responses=True)
             client.ping()
@@ -717,9 +967,12 @@ class AutoWorkMinimal:
 
     def load_bid_messages(self) -> Dict:
         """Load bid messages from JSON file"""
+        if _bid_data_fresh('bid_messages.json'):
+            logging.info("✓ Loaded bid messages (prebuilt)")
+            return _bid_data.MESSAGES
         try:
-            with open('bid_messages.json', 'r') as f:
-                messages = json.load(f)
+            with open('bid_messages.json', 'rb') as f:
+                messages = _json_loads(f.read())
                 logging.info("✓ Loaded bid messages")
                 return messages
         except Exception as e:
@@ -732,20 +985,27 @@ class AutoWorkMinimal:
 
     def load_skills_map(self) -> Dict:
         """Load skills mapping from JSON file"""
+        if _bid_data_fresh('skills_map.json'):
+            logging.info("✓ Loaded skills map (prebuilt)")
+            return _bid_data.SKILLS
         try:
-            with open('skills_map.json', 'r') as f:
-                skills = json.load(f)
+            with open('skills_map.json', 'rb') as f:
+                skills = _json_loads(f.read())
                 logging.info("✓ Loaded skills map")
-                return skills
+                # Key by job id as int so lookups never stringify ids per bid
+                return {int(k): v for k, v in skills.items()}
         except Exception as e:
             logging.warning(f"Could not load skills map: {e}")
             return {}
 
     def load_specializations(self) -> Dict:
         """Load specializations from JSON file"""
+        if _bid_data_fresh('specializations.json'):
+            logging.info("✓ Loaded specializations (prebuilt)")
+            return _bid_data.SPECIALIZATIONS
         try:
-            with open('specializations.json', 'r') as f:
-                specs = json.load(f)
+            with open('specializations.json', 'rb') as f:
+                specs = _json_loads(f.read())
                 logging.info("✓ Loaded specializations")
                 return specs
         except Exception as e:
@@ -758,58 +1018,137 @@ class AutoWorkMinimal:
             return
         
         try:
-            # Load basic stats
-            self.bid_count = int(self.redis_client.get('bid_count') or 0)
-            self.bids_today = int(self.redis_client.get('bids_today') or 0)
-            self.wins_count = int(self.redis_client.get('wins_count') or 0)
-            self.elite_bid_count = int(self.redis_client.get('elite_bid_count') or 0)
-            
-            # Load processed projects
-            processed_data = self.redis_client.get('processed_projects')
-            if processed_data:
-                self.processed_projects = set(json.loads(processed_data))
+            # Fetch all state keys in a single round trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.mget('bid_count', 'bids_today', 'wins_count', 'elite_bid_count',
+                      'processed_projects', 'skipped_projects', 'last_daily_reset')
+            pipe.zrange(self.PROCESSED_PROJECTS_KEY, 0, -1)
+            pipe.zrange(self.NDA_SIGNED_KEY, 0, -1)
+            pipe.zrange(self.IP_SIGNED_KEY, 0, -1)
+            state, processed_ids, nda_signed, ip_signed = pipe.execute()
+            (bid_count, bids_today, wins_count, elite_bid_count,
+             processed_data, skipped_data, last_daily_reset) = state
+            
+            # Load basic stats (today's count only if it was saved today)
+            self.bid_count = int(bid_count or 0)
+            if last_daily_reset == self.today_date.isoformat():
+                self.bids_today = int(bids_today or 0)
+            self.wins_count = int(wins_count or 0)
+            self.elite_bid_count = int(elite_bid_count or 0)
+            
+            # Load processed projects (the legacy JSON blob is migrated into
+            # the sorted set on the next save)
+            if processed_ids:
+                for pid in processed_ids:  # oldest first
+                    self.remember_processed(pid)
+            elif processed_data:
+                for pid in _json_loads(processed_data):
+                    self.mark_processed(pid)
+                self._legacy_processed_blob = True
             
             # Load skipped projects
-            skipped_data = self.redis_client.get('skipped_projects')
             if skipped_data:
-                self.skipped_projects.update(json.loads(skipped_data))
+                self.skipped_projects.update(_json_loads(skipped_data))
+            
+            # Agreements signed by earlier runs (trimmed sorted sets, no blob to decode)
+            self.nda_signed_projects.update(int(pid) for pid in nda_signed)
+            self.ip_signed_projects.update(int(pid) for pid in ip_signed)
             
             logging.info("✓ Loaded state from Redis")
         except Exception as e:
             logging.warning(f"Could not load state from Redis: {e}")
 
-    def save_state_to_redis(self):
-        """Save bot state to Redis"""
+    def save_state_to_redis(self, force: bool = False):
+        """Save bot state to Redis (skipped while nothing has changed)"""
         if not self.redis_client:
             return
         
+        # Cheap fingerprint of everything below - idle cycles skip the write
+        signature = (self.bid_count, self.bids_today, self.wins_count, self.elite_bid_count,
+                     self._processed_total, sum(self.skipped_projects.values()),
+                     self.today_date)
+        now_mono = time.monotonic()
+        if not force and signature == self._saved_state_signature:
+            # Idle cycle: nothing to write beyond an occasional liveness stamp
+            if now_mono - self._last_state_save_mono >= self.SAVE_STATE_INTERVAL:
+                try:
+                    self.redis_client.set('last_update', datetime.now().isoformat())
+                    self._last_state_save_mono = now_mono
+                except Exception as e:
+                    logging.warning(f"Could not save state to Redis: {e}")
+            return
+        
         try:
-            # Save basic stats
-            self.redis_client.set('bid_count', self.bid_count)
-            self.redis_client.set('bids_today', self.bids_today)
-            self.redis_client.set('wins_count', self.wins_count)
-            self.redis_client.set('elite_bid_count', self.elite_bid_count)
+            # Queue every write and send them in one round trip
+            pipe = self.redis_client.pipeline(transaction=False)
             
-            # Save processed projects
-            self.redis_client.set('processed_projects', json.dumps(list(self.processed_projects)))
+            # Save basic stats
+            pipe.set('bid_count', self.bid_count)
+            pipe.set('bids_today', self.bids_today)
+            pipe.set('wins_count', self.wins_count)
+            pipe.set('elite_bid_count', self.elite_bid_count)
+            
+            # Save processed projects - only ids added since the last save
+            new_ids = self._processed_pending
+            if new_ids:
+                now = time.time()
+                pipe.zadd(self.PROCESSED_PROJECTS_KEY, {pid: now for pid in new_ids})
+                pipe.zremrangebyrank(self.PROCESSED_PROJECTS_KEY, 0, -self.PROCESSED_PROJECTS_CAP - 1)
+            if self._legacy_processed_blob:
+                pipe.delete('processed_projects')  # migrated legacy JSON blob
             
             # Save skipped projects
-            self.redis_client.set('skipped_projects', json.dumps(self.skipped_projects))
-            
-            # Save current time
-            self.redis_client.set('last_update', datetime.now().isoformat())
+            pipe.set('skipped_projects', _json_dumps(self.skipped_projects))
+            
+            # Save the day bids_today belongs to and the current time
+            pipe.set('last_daily_reset', self.today_date.isoformat())
+            pipe.set('last_update', datetime.now().isoformat())
+            
+            # Dashboard records of bids placed since the last save
+            recent_bids = self._recent_bids_pending
+            for key, bid_info in recent_bids:
+                pipe.setex(key, 86400, bid_info)  # Expire in 24 hours
+            if recent_bids:
+                pipe.keys('bid:*')  # last, for the trim below
+            
+            results = pipe.execute()
+            if recent_bids:
+                # Keep only last 20 bids
+                bid_keys = sorted(results[-1], reverse=True)
+                if len(bid_keys) > 20:
+                    self.redis_client.delete(*bid_keys[20:])
+                self._recent_bids_pending = []
+            self._processed_pending = set()
+            self._legacy_processed_blob = False
+            self._saved_state_signature = signature
+            self._last_state_save_mono = now_mono
         except Exception as e:
             logging.warning(f"Could not save state to Redis: {e}")
 
+    def remember_processed(self, project_id) -> int:
+        """Add a project id to the bounded in-memory processed set"""
+        project_id = int(project_id)
+        if project_id not in self.processed_projects:
+            self.processed_projects.add(project_id)
+            self._processed_order.append(project_id)
+            self._processed_total += 1
+            if len(self._processed_order) > self.PROCESSED_PROJECTS_LOCAL_CAP:
+                self.processed_projects.discard(self._processed_order.popleft())
+        return project_id
+
+    def mark_processed(self, project_id) -> None:
+        """Remember a project as handled; persisted by the next state save"""
+        self._processed_pending.add(self.remember_processed(project_id))
+
     def verify_token_on_startup(self) -> bool:
         """Verify token is valid before starting bot"""
         try:
             logging.info("Verifying token validity...")
             
             # Test with user endpoint
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/users/0.1/users/{self.user_id}",
-                headers=self.headers
+                timeout=self.request_timeout
             )
             
             if response.status_code == 401:
@@ -820,13 +1159,15 @@ class AutoWorkMinimal:
                 logging.error("="*60)
                 
                 if self.redis_client:
-                    self.redis_client.set('bot_status', 'Error - Invalid Token')
-                    self.redis_client.set('last_error', 'Token authentication failed')
+                    self.redis_client.mset({
+                        'bot_status': 'Error - Invalid Token',
+                        'last_error': 'Token authentication failed'
+                    })
                 
                 return False
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 username = data.get('result', {}).get('username', 'Unknown')
                 logging.info(f"✅ Token valid - Logged in as: {username}")
                 return True
@@ -840,12 +1181,16 @@ class AutoWorkMinimal:
 
     def validate_project_data(self, project: Dict) -> bool:
         """Validate that project data is complete and valid"""
-        required_fields = ['id', 'title', 'description', 'budget', 'currency']
+        required_fields = ['id', 'title', 'budget', 'currency']
         
         for field in required_fields:
             if field not in project:
                 return False
         
+        # Full text only when requested; the listing always carries a preview
+        if 'description' not in project and 'preview_description' not in project:
+            return False
+        
         # Check budget structure
         budget = project.get('budget', {})
         if not isinstance(budget, dict):
@@ -859,15 +1204,15 @@ class AutoWorkMinimal:
     def analyze_client(self, employer_id: int) -> Dict:
         """Analyze client for quality indicators"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/users/0.1/users/{employer_id}",
-                headers=self.headers
+                timeout=self.request_timeout
             )
             
             if response.status_code != 200:
                 return {'is_good_client': False, 'reason': 'Could not fetch client data'}
             
-            data = response.json()
+            data = _json_loads(response.content)
             user = data.get('result', {})
             
             # Basic checks
@@ -899,15 +1244,15 @@ class AutoWorkMinimal:
     def analyze_client_for_inr_pkr(self, employer_id: int) -> Dict:
         """Special client analysis for INR projects - targets clients without payment verification"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/users/0.1/users/{employer_id}",
-                headers=self.headers
+                timeout=self.request_timeout
             )
             
             if response.status_code != 200:
                 return {'is_good_client': True, 'reason': 'Could not fetch client data - allowing'}
             
-            data = response.json()
+            data = _json_loads(response.content)
             user = data.get('result', {})
             status = user.get('status', {})
             
@@ -1005,179 +1350,281 @@ class AutoWorkMinimal:
             return 0.0
         
         # Our skills from specializations
-        our_skills = []
-        for category, skills in self.specializations.items():
-            if isinstance(skills, list):
-                our_skills.extend([skill.lower() for skill in skills])
-        
-        if not our_skills:
+        if not self._our_skills:
             return 0.5  # Default score if no skills defined
         
         # Calculate match
-        matching_skills = set(project_skills) & set(our_skills)
+        matching_skills = self._our_skills.intersection(project_skills)
         match_score = len(matching_skills) / len(project_skills)
         
         return min(match_score, 1.0)
 
     def is_elite_project(self, project: Dict) -> bool:
         """Check if project is elite"""
-        upgrades = project.get('upgrades', {})
-        return upgrades.get('featured', False) or upgrades.get('qualified', False)
+        upgrades = project.get('upgrades') or {}
+        return any(upgrades.get(key) for key in self.ELITE_UPGRADES)
 
     def get_active_projects(self, limit: int = 50) -> List[Dict]:
         """Fetch active projects from Freelancer API"""
+        params = {'limit': limit}
+        # Full descriptions are the bulk of the payload and nothing on the bid
+        # path reads them; the API's preview_description covers validation
+        if self.config['filtering'].get('full_description', False):
+            params['full_description'] = 'true'
+        # After the first poll only ask for projects submitted since the newest
+        # one already seen; the boundary project comes back and is deduped
+        if self._projects_from_time:
+            params['from_time'] = self._projects_from_time
+        
         try:
-            response = requests.get(
-                f"{self.api_base}/projects/0.1/projects/active",
-                headers=self.headers,
-                params={
-                    'limit': limit,
-                    'job_details': 'true',
-                    'full_description': 'true'
-                }
+            response = self.session.get(
+                self._projects_endpoint,
+                params=params,
+                headers={'If-None-Match': self._projects_etag} if self._projects_etag else None,
+                stream=ijson is not None,
+                timeout=self.request_timeout
             )
             
-            if response.status_code == 200:
-                data = response.json()
-                projects = data.get('result', {}).get('projects', [])
-                logging.info(f"Fetched {len(projects)} active projects")
-                return projects
-            else:
-                logging.error(f"Failed to fetch projects: {response.status_code}")
-                return []
+            with response:
+                if response.status_code == 304:
+                    logging.info("Project listing unchanged - reusing %s projects", len(self._projects_cache))
+                    return self._projects_cache
+                
+                if response.status_code == 200:
+                    self._projects_etag = response.headers.get('ETag')
+                    if ijson is not None:
+                        response.raw.decode_content = True
+                        projects = list(ijson.items(response.raw, 'result.projects.item', use_float=True))
+                    else:
+                        # No ETag support guaranteed - skip the parse if the body is byte-identical
+                        body = response.content
+                        digest = hashlib.blake2b(body, digest_size=8).digest()
+                        if digest == self._projects_digest:
+                            logging.info("Project listing unchanged - reusing %s projects", len(self._projects_cache))
+                            return self._projects_cache
+                        data = _json_loads(body)
+                        projects = data.get('result', {}).get('projects', [])
+                        self._projects_digest = digest
+                    
+                    if not projects and self._projects_from_time:
+                        logging.info("No projects since last poll - reusing %s projects", len(self._projects_cache))
+                        return self._projects_cache
+                    
+                    newest = max((p.get('time_submitted') or 0 for p in projects), default=0)
+                    if newest:
+                        self._projects_from_time = max(newest, self._projects_from_time or 0)
+                    self._projects_cache = projects
+                    logging.info("Fetched %s active projects", len(projects))
+                    return projects
+                else:
+                    logging.error("Failed to fetch projects: %s", response.status_code)
+                    return []
                 
         except Exception as e:
-            logging.error(f"Error fetching projects: {e}")
+            logging.error("Error fetching projects: %s", e)
             return []
 
+    def flush_logs(self):
+        """Write out buffered log records (no-op when output isn't buffered)"""
+        if self._log_buffer is not None:
+            self._log_buffer.flush()
+
+    def backoff_delay(self, base: float, error_count: int) -> float:
+        """Seconds to sleep: base, doubled per consecutive error beyond the first
+        (capped at error_retry_delay_seconds), plus up to 10% jitter"""
+        if error_count > 1:
+            cap = self.config['monitoring']['error_retry_delay_seconds']
+            base = min(cap, base * 2 ** min(error_count - 1, 10))
+        # Jitter keeps restarted or parallel workers from polling in lockstep
+        return base + self._rng.uniform(0, 0.1 * base)
+
+    def bid_rate(self) -> Tuple[float, int]:
+        """Bid pacing as (seconds per bid, burst size)"""
+        # Rate limit: max 1 bid per 60 seconds, or the configured bid delay if longer
+        interval = max(60, self.config['bidding']['min_bid_delay_seconds'])
+        burst = max(1, int(self.config['bidding'].get('bid_burst', 1)))
+        return interval, burst
+
+    def bid_tokens(self, interval: float, burst: int) -> float:
+        """Bids currently available in the token bucket"""
+        # Monotonic clock for our own bids, so wall-clock jumps can't skew pacing
+        if self.last_bid_time is None:
+            return float(burst)
+        refill = (time.monotonic() - self.last_bid_time) / interval
+        return min(float(burst), self._bid_tokens + refill)
+
+    def bid_wait_seconds(self) -> float:
+        """Seconds left until the next bid is allowed (0 when free to bid)"""
+        interval, burst = self.bid_rate()
+        
+        # Token bucket refilling one bid per interval, holding up to `burst`
+        tokens = self.bid_tokens(interval, burst)
+        wait = 0.0 if tokens >= 1 else (1 - tokens) * interval
+        # Bids already in flight when a 429 arrived sit out its Retry-After
+        wait = max(wait, self._bids_paused_until - time.monotonic())
+        
+        # Without bursting, also space bids from other processes sharing Redis;
+        # that timestamp is shared across processes and stays wall-clock
+        if burst == 1 and self.redis_client:
+            try:
+                last_bid_time = self.redis_client.get('last_bid_time')
+                if last_bid_time:
+                    last_bid = datetime.fromisoformat(last_bid_time)
+                    wait = max(wait, interval - (datetime.now() - last_bid).total_seconds())
+            except Exception as e:
+                logging.warning(f"Error checking rate limit: {e}")
+        
+        return max(0.0, wait)
+
     def is_rate_limited(self) -> bool:
         """Check if we're currently rate limited"""
-        if not self.redis_client:
-            return False
-        
-        try:
-            last_bid_time = self.redis_client.get('last_bid_time')
-            if last_bid_time:
-                last_bid = datetime.fromisoformat(last_bid_time)
-                time_since_last_bid = (datetime.now() - last_bid).total_seconds()
-                
-                # Rate limit: max 1 bid per 60 seconds (increased from 30)
-                if time_since_last_bid < 60:
-                    return True
-            
-            return False
-        except Exception as e:
-            logging.warning(f"Error checking rate limit: {e}")
-            return False
+        return self.bid_wait_seconds() > 0
 
-    def set_rate_limit_timestamp(self):
-        """Set timestamp for rate limiting"""
+    def set_rate_limit_timestamp(self, now: Optional[datetime] = None):
+        """Spend a bid token and set timestamp for rate limiting"""
+        self._bid_tokens = max(0.0, self.bid_tokens(*self.bid_rate()) - 1)
+        self.last_bid_time = time.monotonic()
         if self.redis_client:
             try:
-                self.redis_client.set('last_bid_time', datetime.now().isoformat())
+                self.redis_client.set('last_bid_time', (now or datetime.now()).isoformat())
             except Exception as e:
                 logging.warning(f"Error setting rate limit timestamp: {e}")
 
     def place_bid(self, project: Dict) -> bool:
         """Place a bid on a project with rate limiting"""
+        # Bind hot lookups once per call
+        info = logging.info
+        error = logging.error
+        
         try:
             project_id = project.get('id')
             
-            # Check if we're rate limited
-            if self.is_rate_limited():
-                logging.warning("Rate limit detected - waiting before placing bid...")
-                time.sleep(60)  # Wait 1 minute if rate limited
-            
             # Get project details to check for NDA/IP requirements
             project_details = self.get_project_details(project)
+            needs_nda = project_details.get('nda', False)
+            needs_ip = project_details.get('ip_contract', False)
+            
+            if needs_nda:
+                info("📋 Project %s requires NDA - checking status...", project_id)
+            if needs_ip:
+                info("📋 Project %s requires IP agreement - checking status...", project_id)
+            
+            # Both agreements are independent round trips - sign them in parallel
+            if needs_nda and needs_ip:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    nda_future = pool.submit(self.check_and_sign_nda, project_id)
+                    ip_future = pool.submit(self.check_and_sign_ip_agreement, project_id)
+                    nda_ok, ip_ok = nda_future.result(), ip_future.result()
+            else:
+                nda_ok = self.check_and_sign_nda(project_id) if needs_nda else True
+                ip_ok = self.check_and_sign_ip_agreement(project_id) if needs_ip else True
             
-            # Check and sign NDA if required
-            if project_details.get('nda', False):
-                logging.info(f"📋 Project {project_id} requires NDA - checking status...")
-                if not self.check_and_sign_nda(project_id):
-                    logging.error(f"❌ Failed to handle NDA for project {project_id} - skipping bid")
-                    return False
-            
-            # Check and sign IP agreement if required
-            if project_details.get('ip_contract', False):
-                logging.info(f"📋 Project {project_id} requires IP agreement - checking status...")
-                if not self.check_and_sign_ip_agreement(project_id):
-                    logging.error(f"❌ Failed to handle IP agreement for project {project_id} - skipping bid")
-                    return False
+            if not nda_ok:
+                error("❌ Failed to handle NDA for project %s - skipping bid", project_id)
+                return False
+            if not ip_ok:
+                error("❌ Failed to handle IP agreement for project %s - skipping bid", project_id)
+                return False
             
             # Calculate bid amount
             bid_amount = self.calculate_bid_amount(project)
             
-            # Select bid message
-            message = self.select_bid_message(project)
+            # Select bid message (cached so retries after a failed POST reuse it)
+            with self._message_lock:
+                message = self._message_cache.get(project_id)
+                if message is None:
+                    message = self.select_bid_message(project, project_details['skills_text'])
+                    self._message_cache[project_id] = message
+                    if len(self._message_cache) > self._message_cache_size:
+                        # Dicts keep insertion order - drop the oldest entry
+                        del self._message_cache[next(iter(self._message_cache))]
             
-            # Ensure user_id is integer
-            bidder_id = int(self.user_id)
+            delivery_days = self.config['bidding']['delivery_days']
             
-            # Prepare bid data
+            # Prepare bid data (user_id is already an int from __init__)
             bid_data = {
                 'project_id': int(project_id),
-                'bidder_id': bidder_id,
+                'bidder_id': self.user_id,
                 'amount': float(bid_amount),
-                'period': int(self.config['bidding']['delivery_days']),
+                'period': int(delivery_days),
                 'milestone_percentage': 100,
                 'description': str(message)
             }
             
-            logging.info(f"Placing bid on project {project_id}:")
-            logging.info(f"  Bidder ID: {bidder_id} (type: {type(bidder_id)})")
-            logging.info(f"  Amount: ${bid_amount}")
-            logging.info(f"  Period: {self.config['bidding']['delivery_days']} days")
-            
-            # Place bid
-            response = requests.post(
-                f"{self.api_base}/projects/0.1/bids/",
-                headers=self.headers,
-                json=bid_data
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                bid_id = data.get('result', {}).get('id')
+            # Pacing, the POST and the bookkeeping run one bid at a time; callers
+            # on other threads have already done their pre-bid I/O above
+            with self._bid_lock:
+                # Single source of bid pacing - agreement signing and message prep above
+                # already overlapped the window, so only wait out what's left of it
+                wait = self.bid_wait_seconds()
+                if wait > 0:
+                    info("⏳ Waiting %.0f seconds before placing bid...", wait)
+                    self.flush_logs()
+                    time.sleep(wait)
                 
-                self.bid_count += 1
-                self.bids_today += 1
+                info("Placing bid on project %s:", project_id)
+                info("  Bidder ID: %s", self.user_id)
+                info("  Amount: $%s", bid_amount)
+                info("  Period: %s days", delivery_days)
                 
-                if self.is_elite_project(project):
-                    self.elite_bid_count += 1
+                # Place bid
+                # Streamed: error bodies are only read as far as the log preview
+                response = self.session.post(self._bids_endpoint, data=_json_dumps(bid_data),
+                                             stream=True, timeout=self.request_timeout)
                 
-                logging.info(f"✅ Bid placed successfully! ID: {bid_id}")
-                logging.info(f"   Amount: ${bid_amount}")
-                logging.info(f"   Project: {project.get('title', 'Unknown')[:50]}...")
+                if response.status_code == 200:
+                    data = _json_loads(response.content)
+                    bid_id = data.get('result', {}).get('id')
                 
-                # Track performance
-                self.track_bid_performance(project, bid_amount, True)
+                    self.bid_count += 1
+                    self.bids_today += 1
                 
-                # Save recent bid info for dashboard
-                self.save_recent_bid(project, bid_amount, bid_id, True)
+                    if project_details['is_elite']:
+                        self.elite_bid_count += 1
                 
-                # Set rate limit timestamp
-                self.set_rate_limit_timestamp()
+                    info("✅ Bid placed successfully! ID: %s", bid_id)
+                    info("   Amount: $%s", bid_amount)
+                    info("   Project: %s...", project.get('title', 'Unknown')[:50])
                 
-                return True
-            elif response.status_code == 429:
-                logging.error(f"Rate limit hit: {response.status_code} - {response.text}")
-                self.set_rate_limit_timestamp()
+                    # Track performance
+                    now = datetime.now()  # shared by every post-bid record
+                    self.track_bid_performance(project, bid_amount, True, now)
                 
-                # Wait longer for rate limit
-                wait_time = 120  # 2 minutes
-                logging.info(f"Waiting {wait_time} seconds due to rate limit...")
-                time.sleep(wait_time)
-                return False
-            else:
-                logging.error(f"Bid failed: {response.status_code} - {response.text}")
-                logging.error(f"Request data: {bid_data}")
-                return False
+                    # Never bid on this project again
+                    self.mark_processed(project_id)
+                
+                    # Only the rate limit timestamp is written now - other processes
+                    # pace against it; the processed id and dashboard bid record go
+                    # out with the end-of-cycle state save
+                    self.set_rate_limit_timestamp(now)
+                    self.save_recent_bid(project, bid_amount, bid_id, True, now, project_details)
+                
+                    return True
+                elif response.status_code == 429:
+                    error("Rate limit hit: %s - %s", response.status_code, _body_preview(response))
+                    response.close()
+                    self.set_rate_limit_timestamp()
+                    self._bid_tokens = 0.0  # no bursting straight after a 429
+                
+                    # Pause bids as long as the API asks, or 2 minutes if it doesn't say,
+                    # capped so a huge header can't park the bot. Nothing sleeps here
+                    # under _bid_lock - the monitor loop and bid_wait_seconds honour it
+                    retry_after = response.headers.get('Retry-After', '')
+                    wait_time = int(retry_after) if retry_after.isdigit() else 120
+                    wait_time = min(wait_time, self.config['monitoring']['error_retry_delay_seconds'])
+                    self._bids_paused_until = time.monotonic() + wait_time
+                    info("Pausing bids for %s seconds due to rate limit...", wait_time)
+                    return False
+                else:
+                    error("Bid failed: %s - %s", response.status_code, _body_preview(response))
+                    response.close()
+                    error("Request data: %s", bid_data)
+                    return False
                 
         except Exception as e:
-            logging.error(f"Error placing bid: {e}")
-            logging.error(f"Project ID: {project.get('id')}")
-            logging.error(f"User ID: {self.user_id} (type: {type(self.user_id)})")
+            error("Error placing bid: %s", e)
+            error("Project ID: %s", project.get('id'))
+            error("User ID: %s (type: %s)", self.user_id, type(self.user_id))
             return False
 
     def calculate_bid_amount(self, project: Dict) -> float:
@@ -1190,67 +1637,72 @@ class AutoWorkMinimal:
         # No currency conversion - bid in the same currency as the project
         return min_budget
 
-    def select_bid_message(self, project: Dict) -> str:
+    def project_skills_text(self, project: Dict) -> str:
+        """Comma-joined names of the project's first three skills"""
+        skills_map_get = self.skills_map.get
+        return ', '.join([job.get('name') or skills_map_get(job.get('id'), '')
+                          for job in project.get('jobs', [])[:3]])
+
+    def select_bid_message(self, project: Dict, skills_text: Optional[str] = None) -> str:
         """Select appropriate bid message for project"""
-        messages = self.bid_messages.get('professional', [])
+        messages = self._bid_templates
         
         if not messages:
             return "I'm interested in your project and ready to start immediately."
         
-        # Select random message
-        import random
-        message = random.choice(messages)
+        # Next template in the shuffled rotation
+        message = next(self._template_cycle)
         
-        # Replace placeholders
-        skills = ', '.join([job.get('name', '') for job in project.get('jobs', [])[:3]])
-        project_title = project.get('title', 'your project')
-        delivery_days = self.config['bidding']['delivery_days']
-        
-        message = message.replace('{skills}', skills)
-        message = message.replace('{project_title}', project_title)
-        message = message.replace('{days}', str(delivery_days))
-        
-        return message
+        # Fill every placeholder in one pass; unknown ones render empty
+        skills = skills_text if skills_text is not None else self.project_skills_text(project)
+        return message.format_map(_TemplateFields(
+            skills=skills,
+            project_title=project.get('title', 'your project'),
+            days=self._template_days
+        ))
 
-    def track_bid_performance(self, project: Dict, bid_amount: float, success: bool):
+    def track_bid_performance(self, project: Dict, bid_amount: float, success: bool,
+                              now: Optional[datetime] = None):
         """Track bid performance for analytics"""
         if not self.config['performance']['track_analytics']:
             return
         
         # Track by hour
-        hour = datetime.now().hour
+        hour = (now or datetime.now()).hour
         if hour not in self.performance_data['by_hour']:
             self.performance_data['by_hour'][hour] = {'bids': 0, 'amount': 0}
         
         self.performance_data['by_hour'][hour]['bids'] += 1
         self.performance_data['by_hour'][hour]['amount'] += bid_amount
 
-    def save_recent_bid(self, project: Dict, bid_amount: float, bid_id: str, success: bool):
-        """Save recent bid information for dashboard display"""
+    def save_recent_bid(self, project: Dict, bid_amount: float, bid_id: str, success: bool,
+                        now: Optional[datetime] = None, details: Optional[Dict] = None):
+        """Queue recent bid information for dashboard display
+        
+        Written by the next save_state_to_redis, in the same round trip as the
+        rest of the state; `details` (from get_project_details) saves
+        re-deriving elite/skills.
+        """
         if not self.redis_client:
             return
         
         try:
+            now = now or datetime.now()
+            if details is None:
+                details = self.get_project_details(project)
             bid_info = {
                 'project_id': project.get('id'),
                 'project_title': project.get('title', 'Unknown'),
                 'amount': bid_amount,
                 'bid_id': bid_id,
                 'status': 'success' if success else 'failed',
-                'timestamp': datetime.now().isoformat(),
-                'is_elite': self.is_elite_project(project),
-                'skills': ', '.join([j.get('name', '') for j in project.get('jobs', [])[:3]])
+                'timestamp': now.isoformat(),
+                'is_elite': details['is_elite'],
+                'skills': details['skills_text']
             }
             
-            # Save to Redis with timestamp as key for sorting
-            timestamp_key = f"bid:{datetime.now().timestamp()}"
-            self.redis_client.setex(timestamp_key, 86400, json.dumps(bid_info))  # Expire in 24 hours
-            
-            # Keep only last 20 bids
-            bid_keys = sorted(self.redis_client.keys('bid:*'), reverse=True)
-            if len(bid_keys) > 20:
-                for old_key in bid_keys[20:]:
-                    self.redis_client.delete(old_key)
+            # Timestamp as key for sorting
+            self._recent_bids_pending.append((f"bid:{now.timestamp()}", _json_dumps(bid_info)))
                     
         except Exception as e:
             logging.warning(f"Error saving recent bid: {e}")
@@ -1265,25 +1717,33 @@ class AutoWorkMinimal:
         except Exception as e:
             logging.warning(f"Error processing contests: {e}")
 
+    def next_midnight_epoch(self, today=None) -> float:
+        """Epoch seconds of the next local midnight"""
+        tomorrow = (today or datetime.now().date()) + timedelta(days=1)
+        return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
     def reset_daily_stats(self):
         """Reset daily statistics"""
-        if datetime.now().date() != self.today_date:
-            self.bids_today = 0
-            self.today_date = datetime.now().date()
-            logging.info("📅 Daily stats reset")
+        # Plain float compare until the day actually rolls over
+        if time.time() < self._next_day_epoch:
+            return
+        self.bids_today = 0
+        self.today_date = datetime.now().date()
+        self._next_day_epoch = self.next_midnight_epoch(self.today_date)
+        logging.info("📅 Daily stats reset")
 
     def analyze_client_simple(self, employer_id: int) -> Dict:
         """Simple client analysis - only check payment verification or deposit"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/users/0.1/users/{employer_id}",
-                headers=self.headers
+                timeout=self.request_timeout
             )
             
             if response.status_code != 200:
                 return {'is_good_client': True, 'reason': 'Could not fetch client data - allowing'}
             
-            data = response.json()
+            data = _json_loads(response.content)
             user = data.get('result', {})
             status = user.get('status', {})
             
@@ -1310,6 +1770,18 @@ class AutoWorkMinimal:
             logging.warning(f"Error in simple client analysis: {e}")
             return {'is_good_client': True, 'reason': 'Analysis failed - allowing'}
 
+    def remember_signed(self, signed: set, key: str, project_id: int) -> None:
+        """Record a signed agreement locally and in its capped Redis sorted set"""
+        signed.add(project_id)
+        if self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.zadd(key, {project_id: time.time()})
+                pipe.zremrangebyrank(key, 0, -self.SIGNED_PROJECTS_CAP - 1)
+                pipe.execute()
+            except Exception as e:
+                logging.warning(f"Could not record signed agreement: {e}")
+
     def check_and_sign_nda(self, project_id: int) -> bool:
         """Check and sign NDA for a project if required and unsigned"""
         try:
@@ -1318,47 +1790,53 @@ class AutoWorkMinimal:
                 logging.info(f"Auto-sign NDA is disabled for project {project_id}")
                 return True  # Return True to continue with bidding
             
+            # Signed earlier in this run - skip the status round trip
+            if project_id in self.nda_signed_projects:
+                return True
+            
             # Check NDA status
             endpoint = f"{self.api_base}/projects/0.1/projects/{project_id}/nda"
-            response = requests.get(endpoint, headers=self.headers)
-            
-            if response.status_code == 200:
-                data = response.json()
-                result = data.get('result', {})
-                status = result.get('status', 'unknown')
-                
-                logging.info(f"📋 NDA Status for project {project_id}: {status}")
+            # Streamed so 404/error bodies are never downloaded
+            with self.session.get(endpoint, stream=True, timeout=self.request_timeout) as response:
                 
-                if status == 'unsigned':
-                    logging.info(f"🖊️  Attempting to sign NDA for project {project_id}...")
+                if response.status_code == 200:
+                    data = _json_loads(response.content)
+                    result = data.get('result', {})
+                    status = result.get('status', 'unknown')
                     
-                    # Sign NDA
-                    sign_endpoint = f"{self.api_base}/projects/0.1/projects/{project_id}/nda/sign"
-                    sign_response = requests.post(sign_endpoint, headers=self.headers, json={})
+                    logging.info(f"📋 NDA Status for project {project_id}: {status}")
                     
-                    if sign_response.status_code in [200, 201]:
-                        logging.info(f"✅ Successfully signed NDA for project {project_id}")
-                        self.nda_signed_projects.add(project_id)
+                    if status == 'unsigned':
+                        logging.info(f"🖊️  Attempting to sign NDA for project {project_id}...")
+                        
+                        # Sign NDA
+                        sign_endpoint = f"{self.api_base}/projects/0.1/projects/{project_id}/nda/sign"
+                        with self.session.post(sign_endpoint, json={}, stream=True,
+                                               timeout=self.request_timeout) as sign_response:
+                            
+                            if sign_response.status_code in [200, 201]:
+                                logging.info(f"✅ Successfully signed NDA for project {project_id}")
+                                self.remember_signed(self.nda_signed_projects, self.NDA_SIGNED_KEY, project_id)
+                                return True
+                            else:
+                                logging.error(f"❌ Failed to sign NDA for project {project_id}: {sign_response.status_code}")
+                                logging.error("Response: %s", _body_preview(sign_response))
+                                return False
+                    elif status == 'signed':
+                        logging.info(f"✅ NDA already signed for project {project_id}")
+                        self.remember_signed(self.nda_signed_projects, self.NDA_SIGNED_KEY, project_id)
                         return True
                     else:
-                        logging.error(f"❌ Failed to sign NDA for project {project_id}: {sign_response.status_code}")
-                        logging.error(f"Response: {sign_response.text}")
-                        return False
-                elif status == 'signed':
-                    logging.info(f"✅ NDA already signed for project {project_id}")
-                    self.nda_signed_projects.add(project_id)
+                        logging.info(f"ℹ️  NDA status for project {project_id}: {status}")
+                        return True
+                        
+                elif response.status_code == 404:
+                    logging.info(f"ℹ️  No NDA required for project {project_id}")
                     return True
                 else:
-                    logging.info(f"ℹ️  NDA status for project {project_id}: {status}")
-                    return True
+                    logging.error(f"❌ Error checking NDA for project {project_id}: {response.status_code}")
+                    return False
                     
-            elif response.status_code == 404:
-                logging.info(f"ℹ️  No NDA required for project {project_id}")
-                return True
-            else:
-                logging.error(f"❌ Error checking NDA for project {project_id}: {response.status_code}")
-                return False
-                
         except Exception as e:
             logging.error(f"❌ Exception checking/signing NDA for project {project_id}: {e}")
             return False
@@ -1371,47 +1849,53 @@ class AutoWorkMinimal:
                 logging.info(f"Auto-sign IP agreement is disabled for project {project_id}")
                 return True  # Return True to continue with bidding
             
+            # Signed earlier in this run - skip the status round trip
+            if project_id in self.ip_signed_projects:
+                return True
+            
             # Check IP agreement status
             endpoint = f"{self.api_base}/projects/0.1/projects/{project_id}/ip_contract"
-            response = requests.get(endpoint, headers=self.headers)
-            
-            if response.status_code == 200:
-                data = response.json()
-                result = data.get('result', {})
-                status = result.get('status', 'unknown')
+            # Streamed so 404/error bodies are never downloaded
+            with self.session.get(endpoint, stream=True, timeout=self.request_timeout) as response:
                 
-                logging.info(f"📋 IP Agreement Status for project {project_id}: {status}")
-                
-                if status == 'unsigned':
-                    logging.info(f"🖊️  Attempting to sign IP agreement for project {project_id}...")
+                if response.status_code == 200:
+                    data = _json_loads(response.content)
+                    result = data.get('result', {})
+                    status = result.get('status', 'unknown')
                     
-                    # Sign IP agreement
-                    sign_endpoint = f"{self.api_base}/projects/0.1/projects/{project_id}/ip_contract/sign"
-                    sign_response = requests.post(sign_endpoint, headers=self.headers, json={})
+                    logging.info(f"📋 IP Agreement Status for project {project_id}: {status}")
                     
-                    if sign_response.status_code in [200, 201]:
-                        logging.info(f"✅ Successfully signed IP agreement for project {project_id}")
-                        self.ip_signed_projects.add(project_id)
+                    if status == 'unsigned':
+                        logging.info(f"🖊️  Attempting to sign IP agreement for project {project_id}...")
+                        
+                        # Sign IP agreement
+                        sign_endpoint = f"{self.api_base}/projects/0.1/projects/{project_id}/ip_contract/sign"
+                        with self.session.post(sign_endpoint, json={}, stream=True,
+                                               timeout=self.request_timeout) as sign_response:
+                            
+                            if sign_response.status_code in [200, 201]:
+                                logging.info(f"✅ Successfully signed IP agreement for project {project_id}")
+                                self.remember_signed(self.ip_signed_projects, self.IP_SIGNED_KEY, project_id)
+                                return True
+                            else:
+                                logging.error(f"❌ Failed to sign IP agreement for project {project_id}: {sign_response.status_code}")
+                                logging.error("Response: %s", _body_preview(sign_response))
+                                return False
+                    elif status == 'signed':
+                        logging.info(f"✅ IP agreement already signed for project {project_id}")
+                        self.remember_signed(self.ip_signed_projects, self.IP_SIGNED_KEY, project_id)
                         return True
                     else:
-                        logging.error(f"❌ Failed to sign IP agreement for project {project_id}: {sign_response.status_code}")
-                        logging.error(f"Response: {sign_response.text}")
-                        return False
-                elif status == 'signed':
-                    logging.info(f"✅ IP agreement already signed for project {project_id}")
-                    self.ip_signed_projects.add(project_id)
+                        logging.info(f"ℹ️  IP agreement status for project {project_id}: {status}")
+                        return True
+                        
+                elif response.status_code == 404:
+                    logging.info(f"ℹ️  No IP agreement required for project {project_id}")
                     return True
                 else:
-                    logging.info(f"ℹ️  IP agreement status for project {project_id}: {status}")
-                    return True
+                    logging.error(f"❌ Error checking IP agreement for project {project_id}: {response.status_code}")
+                    return False
                     
-            elif response.status_code == 404:
-                logging.info(f"ℹ️  No IP agreement required for project {project_id}")
-                return True
-            else:
-                logging.error(f"❌ Error checking IP agreement for project {project_id}: {response.status_code}")
-                return False
-                
         except Exception as e:
             logging.error(f"❌ Exception checking/signing IP agreement for project {project_id}: {e}")
             return False
@@ -1430,7 +1914,9 @@ class AutoWorkMinimal:
             'non_compete': upgrades.get('non_compete', False),
             'urgent': upgrades.get('urgent', False),
             'qualified': upgrades.get('qualified', False),
+            'is_elite': self.is_elite_project(project),
             'budget': project.get('budget', {}),
+            'skills_text': self.project_skills_text(project),
             'url': f"https://www.freelancer.com/projects/{project.get('seo_url', '')}"
         }
         
@@ -13,8 +13,15 @@ import requests
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+# orjson parses the contest listings several times faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class ContestHandler:
-    def __init__(self, token: str, user_id: str):
+    def __init__(self, token: str, user_id: str, session: Optional[requests.Session] = None):
         self.token = token
         self.user_id = user_id
         self.api_base = "https://www.freelancer.com/api"
@@ -25,6 +32,9 @@ class ContestHandler:
             "Content-Type": "application/json"
         }
         
+        # Reuse the caller's pooled keep-alive connections when given one
+        self.session = session or requests.Session()
+        
         # Contest tracking
         self.processed_contests = set()
         self.entered_contests = set()
@@ -84,7 +94,7 @@ class ContestHandler:
                 "upgrade_details": "true"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 endpoint,
                 headers=self.headers,
                 params=params,
@@ -92,7 +102,7 @@ class ContestHandler:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 contests = data.get('result', {}).get('contests', [])
                 logging.info(f"✓ Fetched {len(contests)} active contests")
                 return contests
@@ -109,14 +119,14 @@ class ContestHandler:
         try:
             endpoint = f"{self.api_base}/contests/0.1/contests/{contest_id}"
             
-            response = requests.get(
+            response = self.session.get(
                 endpoint,
                 headers=self.headers,
                 timeout=30
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 return data.get('result', {})
             else:
                 logging.error(f"Failed to get contest details: {response.status_code}")
@@ -285,7 +295,7 @@ Looking forward to your feedback!"""
                 # For writing contests
                 submission_data['content'] = entry_data['content']
             
-            response = requests.post(
+            response = self.session.post(
                 endpoint,
                 headers=self.headers,
                 json=submission_data,
@@ -293,7 +303,7 @@ Looking forward to your feedback!"""
             )
             
             if response.status_code in [200, 201]:
-                result = response.json()
+                result = _json_loads(response.content)
                 entry_id = result.get('result', {}).get('id')
                 
                 # Track the entry
@@ -87,7 +87,7 @@ def run_autowork():
                         
                         new_bids = 0
                         for project in projects:
-                            project_id = project.get("id")
+                            project_id = int(project["id"])  # processed ids are ints
                             
                             # Skip if already processed
                             if project_id in app.processed_projects:
@@ -101,14 +101,13 @@ def run_autowork():
                                 success = app.place_bid(project)
                                 
                                 if success:
-                                    new_bids += 1
-                                    time.sleep(5)  # Wait between bids
+                                    new_bids += 1  # place_bid paces the next bid itself
                                 
                                 # Limit bids per cycle
                                 if new_bids >= 5:
                                     break
                             else:
-                                app.processed_projects.add(project_id)
+                                app.mark_processed(project_id)
                         
                         logger.info(f"Placed {new_bids} new bids this cycle")
                         error_count = 0
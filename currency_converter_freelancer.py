@@ -9,11 +9,14 @@ import json
 import os
 import logging
 from datetime import datetime, timedelta
+from typing import Optional
 
 class CurrencyConverter:
-    def __init__(self, freelancer_token=None):
+    def __init__(self, freelancer_token=None, session: Optional[requests.Session] = None):
         self.token = freelancer_token or os.environ.get('FREELANCER_OAUTH_TOKEN')
         self.api_base = "https://www.freelancer.com/api"
+        # Reuse the caller's pooled keep-alive connections when given one
+        self.session = session or requests.Session()
         self.rates = {}
         self.cache_file = "freelancer_currencies.json"
         self.last_update = None
@@ -73,7 +76,7 @@ class CurrencyConverter:
             }
             
             # Freelancer provides currency exchange rates in their API
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/projects/0.1/currencies",
                 headers=headers,
                 timeout=10
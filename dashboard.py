@@ -52,9 +52,9 @@ def get_bot_stats():
             elite_percentage = (elite_bid_count / bid_count * 100) if bid_count > 0 else 0
             success_rate = win_rate  # For now, assume success rate = win rate
             
-            # Get processed projects count
-            processed_data = redis_client.get('processed_projects')
-            processed_count = 0
+            # Get processed projects count (sorted set, or the legacy JSON blob)
+            processed_count = redis_client.zcard('processed_projects_zset')
+            processed_data = None if processed_count else redis_client.get('processed_projects')
             if processed_data:
                 try:
                     processed_projects = json.loads(processed_data)
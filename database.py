@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON, event, func, select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from datetime import datetime
 import json
 
@@ -23,7 +25,7 @@ class Project(Base):
     is_elite = Column(Boolean, default=False)
     time_submitted = Column(DateTime)
     raw_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     
 class Bid(Base):
     __tablename__ = "bids"
@@ -36,7 +38,7 @@ class Bid(Base):
     description = Column(Text)
     status = Column(String(50))  # success, failed, pending
     response_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 class RateLimit(Base):
     __tablename__ = "rate_limits"
@@ -45,11 +47,65 @@ class RateLimit(Base):
     endpoint = Column(String(100))
     timestamp = Column(DateTime, default=datetime.utcnow)
 
+# Run on every new SQLite connection: WAL lets the dashboard read while the
+# bot writes, and synchronous=NORMAL skips the per-commit fsync pair that the
+# default rollback journal needs
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Open connections kept per SQLite file, so page cache and PRAGMAs persist
+# across sessions instead of each session reopening the file
+SQLITE_POOL_SIZE = 4
+
+# Prepared statements sqlite3 keeps per connection (its default is 128)
+SQLITE_CACHED_STATEMENTS = 256
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+def summary_counts_query(since: datetime):
+    """Project and bid counts as one SELECT of scalar subqueries
+    
+    Row: total_projects, recent_projects (created after `since`, naive UTC
+    like created_at), total_bids, successful_bids.
+    """
+    return select(
+        select(func.count(Project.id)).scalar_subquery().label("total_projects"),
+        select(func.count(Project.id)).where(Project.created_at > since).scalar_subquery().label("recent_projects"),
+        select(func.count(Bid.id)).scalar_subquery().label("total_bids"),
+        select(func.count(Bid.id)).where(Bid.status == "success").scalar_subquery().label("successful_bids"),
+    )
+
 async def init_db(database_url: str):
-    engine = create_async_engine(database_url, echo=False)
+    url = make_url(database_url)
+    engine_options = {}
+    if url.get_backend_name() == "sqlite":
+        engine_options["connect_args"] = {"cached_statements": SQLITE_CACHED_STATEMENTS}
+        if url.database not in (None, "", ":memory:"):
+            engine_options.update(poolclass=AsyncAdaptedQueuePool, pool_size=SQLITE_POOL_SIZE)
+    
+    engine = create_async_engine(database_url, echo=False, **engine_options)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all only indexes tables it creates; databases from before the
+        # created_at indexes get them here (same names, so a no-op on new ones)
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_projects_created_at ON projects (created_at)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_bids_created_at ON bids (created_at)"
+        ))
     
     async_session = sessionmaker(
         engine, class_=AsyncSession, expire_on_commit=False
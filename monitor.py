@@ -1,6 +1,8 @@
 import asyncio
-from datetime import datetime, timedelta
-from typing import Set, List, Dict
+import hashlib
+import time
+from datetime import datetime
+from typing import List, Dict
 import json
 import os
 from rich.console import Console
@@ -14,8 +16,21 @@ from config import settings
 console = Console()
 
 class RealtimeMonitor:
+    # Seen ids kept in memory; the oldest are dropped down to SAVED_SEEN_PROJECTS
+    MAX_SEEN_PROJECTS = 20000
+    SAVED_SEEN_PROJECTS = 10000
+    
+    # Adaptive polling: check_interval_seconds is scaled down after cycles that
+    # found new projects and up after empty ones, within these bounds
+    POLL_SCALE_MIN = 0.2
+    POLL_SCALE_MAX = 2.0
+    
     def __init__(self):
-        self.seen_projects: Set[int] = set()
+        # Insertion-ordered dict used as a set, so the oldest ids come first
+        self.seen_projects: Dict[int, None] = {}
+        # Title/description digests of seen projects, to catch reposts under a new id
+        self.seen_content: Dict[bytes, None] = {}
+        self._poll_scale = 1.0
         self.stats = {
             "projects_checked": 0,
             "new_projects_found": 0,
@@ -30,14 +45,21 @@ class RealtimeMonitor:
         if os.path.exists("seen_projects.json"):
             with open("seen_projects.json", "r") as f:
                 data = json.load(f)
-                self.seen_projects = set(data)
+                self.seen_projects = dict.fromkeys(data)
     
     def save_seen_projects(self):
         """Save seen projects to file"""
-        recent_projects = list(self.seen_projects)[-10000:]
+        recent_projects = list(self.seen_projects)[-self.SAVED_SEEN_PROJECTS:]
         with open("seen_projects.json", "w") as f:
             json.dump(recent_projects, f)
     
+    @staticmethod
+    def content_key(project: Dict) -> bytes:
+        """64-bit digest of a project's title and description"""
+        description = project.get("preview_description") or project.get("description", "")
+        text = f"{project.get('title', '')}\0{description}"
+        return hashlib.blake2b(text.encode(), digest_size=8).digest()
+    
     def generate_status_table(self) -> Table:
         """Generate status table for display"""
         table = Table(title="AutoWork Realtime Monitor")
@@ -64,35 +86,51 @@ class RealtimeMonitor:
         
         priority_skills = settings.priority_skills[:5]
         
-        for skill in priority_skills:
-            projects = await autowork.fetch_projects(skill, limit=20)
+        # Concurrent searches, spaced by the rate limiter
+        results = await asyncio.gather(
+            *[autowork.fetch_projects(skill, limit=20) for skill in priority_skills]
+        )
+        for projects in results:
             all_projects.extend(projects)
-            await asyncio.sleep(1)
         
         new_projects = []
+        # time_submitted is epoch seconds - compare against one cutoff
+        very_new_after = time.time() - settings.bid_immediately_threshold_minutes * 60
         for project in all_projects:
             if project["id"] not in self.seen_projects:
-                self.seen_projects.add(project["id"])
-                new_projects.append(project)
+                self.seen_projects[project["id"]] = None
+                
+                content_key = self.content_key(project)
+                if content_key in self.seen_content:
+                    log_info(f"Skipping repost: {project.get('title', '')}")
+                    continue
+                self.seen_content[content_key] = None
                 
-                time_submitted = datetime.fromtimestamp(project.get("time_submitted", 0))
-                project_age = datetime.now() - time_submitted
+                new_projects.append(project)
                 
-                if project_age < timedelta(minutes=settings.bid_immediately_threshold_minutes):
+                if (project.get("time_submitted") or 0) > very_new_after:
                     project["is_very_new"] = True
         
+        if len(self.seen_projects) > self.MAX_SEEN_PROJECTS:
+            recent_projects = list(self.seen_projects)[-self.SAVED_SEEN_PROJECTS:]
+            self.seen_projects = dict.fromkeys(recent_projects)
+        if len(self.seen_content) > self.MAX_SEEN_PROJECTS:
+            recent_content = list(self.seen_content)[-self.SAVED_SEEN_PROJECTS:]
+            self.seen_content = dict.fromkeys(recent_content)
+        
+        # Newest first across all searches, so the freshest projects are bid on first
+        new_projects.sort(key=lambda p: p.get("time_submitted") or 0, reverse=True)
+        
         self.stats["projects_checked"] += len(all_projects)
         self.stats["new_projects_found"] += len(new_projects)
         
         return new_projects
     
-    async def process_new_project(self, autowork: AutoWork, project: Dict):
-        """Process a new project"""
+    async def process_new_project(self, autowork: AutoWork, project: Dict, session=None):
+        """Process a new project (bid records join `session` when given)"""
         log_info(f"\n[NEW] {project['title']}")
         log_info(f"Budget: ${project['budget']['minimum']} - ${project['budget']['maximum']}")
-        log_info(f"Skills: {', '.join([j['name'] for j in project['jobs'][:5]])}")
-        
-        await autowork.save_project(project, "realtime")
+        log_info(f"Skills: {', '.join(autowork.skill_names(project)[:5])}")
         
         if not autowork.should_bid_on_project(project):
             log_info("→ Skipping: Doesn't meet criteria")
@@ -102,7 +140,7 @@ class RealtimeMonitor:
             log_success("→ VERY NEW PROJECT! Bidding immediately...")
             self.stats["bids_attempted"] += 1
             
-            result = await autowork.place_bid(project)
+            result = await autowork.place_bid(project, session)
             if result["success"]:
                 self.stats["bids_successful"] += 1
                 log_success(f"→ ✓ BID PLACED! ID: {result['bid_id']}")
@@ -117,15 +155,34 @@ class RealtimeMonitor:
                     try:
                         new_projects = await self.check_for_new_projects(autowork)
                         
-                        for project in new_projects:
-                            await self.process_new_project(autowork, project)
+                        # The cycle's project rows and bid records commit in one transaction
+                        async with autowork.db_session() as session:
+                            await autowork.save_projects([(project, "realtime") for project in new_projects], session)
+                            
+                            # Bids go out concurrently; each one only adds its record to the session.
+                            # Every task runs to completion, so no bid record arrives after the commit
+                            results = await asyncio.gather(
+                                *[self.process_new_project(autowork, project, session) for project in new_projects],
+                                return_exceptions=True
+                            )
+                            for project, result in zip(new_projects, results):
+                                if isinstance(result, Exception):
+                                    log_error(f"Error processing project {project['id']}: {result}")
+                            
+                            await session.commit()
                         
                         live.update(self.generate_status_table())
                         
                         if len(self.seen_projects) % 100 == 0:
                             self.save_seen_projects()
                         
-                        await asyncio.sleep(settings.check_interval_seconds)
+                        # Poll sooner while new projects keep arriving, back off when quiet
+                        if new_projects:
+                            self._poll_scale = max(self.POLL_SCALE_MIN, self._poll_scale * 0.5)
+                        else:
+                            self._poll_scale = min(self.POLL_SCALE_MAX, self._poll_scale * 1.4)
+                        
+                        await asyncio.sleep(settings.check_interval_seconds * self._poll_scale)
                         
                     except Exception as e:
                         log_error(f"Monitor error: {e}")
@@ -1,91 +1,135 @@
 import asyncio
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from datetime import datetime
 from typing import Dict, Tuple
 import json
 import aiofiles
 import os
 
 class RateLimiter:
+    # The tracking file is rewritten at most this often; close() flushes the rest
+    SAVE_INTERVAL = 10
+    
     def __init__(self, per_second=3, per_hour=600, per_day=3600):
         self.per_second = per_second
         self.per_hour = per_hour
         self.per_day = per_day
-        self.requests = []
+        # Request timestamps (epoch seconds), oldest first, one deque per
+        # window; expired entries are popped off the left as time moves on
+        self.requests = deque()
+        self.last_hour = deque()
+        self.last_second = deque()
         self.lock = asyncio.Lock()
         self.tracking_file = "rate_limit_tracking.json"
-        
+        self._last_save = 0.0
+    
     async def can_make_request(self) -> Tuple[bool, str]:
         """Check if we can make a request"""
         async with self.lock:
-            now = datetime.now()
-            
-            # Clean old requests
-            self.requests = [
-                req for req in self.requests 
-                if now - req < timedelta(days=1)
-            ]
-            
-            # Count requests in different windows
-            last_second = [
-                req for req in self.requests 
-                if now - req < timedelta(seconds=1)
-            ]
-            last_hour = [
-                req for req in self.requests 
-                if now - req < timedelta(hours=1)
-            ]
-            
-            # Check limits
-            if len(last_second) >= self.per_second:
-                return False, f"Rate limit: {self.per_second} per second"
-            
-            if len(last_hour) >= self.per_hour:
-                wait_time = 60 - (now - last_hour[0]).seconds
-                return False, f"Rate limit: {self.per_hour} per hour. Wait {wait_time}s"
-            
-            if len(self.requests) >= self.per_day:
-                wait_time = 86400 - (now - self.requests[0]).seconds
-                return False, f"Rate limit: {self.per_day} per day. Wait {wait_time}s"
-            
-            return True, "OK"
+            can_request, reason, _ = self._check_limits(time.time())
+            return can_request, reason
+    
+    async def acquire(self) -> Tuple[bool, str]:
+        """Wait for a per-second slot, then record the request
+        
+        Concurrent callers are spaced by the limiter instead of fixed sleeps.
+        Hourly and daily limits are not waited out - like can_make_request,
+        those return False with the reason.
+        """
+        while True:
+            async with self.lock:
+                now = time.time()
+                can_request, reason, retry_after = self._check_limits(now)
+                if can_request:
+                    self._append(now)
+                    await self._maybe_save(now)
+                    return True, reason
+                if not retry_after:
+                    return False, reason
+            await asyncio.sleep(retry_after)
+    
+    def _expire(self, now: float):
+        """Drop timestamps that have left each window"""
+        for window, seconds in ((self.requests, 86400), (self.last_hour, 3600), (self.last_second, 1)):
+            while window and now - window[0] >= seconds:
+                window.popleft()
+    
+    def _append(self, now: float):
+        """Record a timestamp in every window"""
+        self.requests.append(now)
+        self.last_hour.append(now)
+        self.last_second.append(now)
+    
+    def _check_limits(self, now: float) -> Tuple[bool, str, float]:
+        """Check every window; the caller holds the lock
+        
+        The last value is the wait until a per-second slot frees up, or 0.
+        """
+        self._expire(now)
+        
+        # Check limits
+        if len(self.last_hour) >= self.per_hour:
+            wait_time = int(3600 - (now - self.last_hour[0]))
+            return False, f"Rate limit: {self.per_hour} per hour. Wait {wait_time}s", 0
+        
+        if len(self.requests) >= self.per_day:
+            wait_time = int(86400 - (now - self.requests[0]))
+            return False, f"Rate limit: {self.per_day} per day. Wait {wait_time}s", 0
+        
+        if len(self.last_second) >= self.per_second:
+            retry_after = 1 - (now - self.last_second[-self.per_second])
+            return False, f"Rate limit: {self.per_second} per second", max(retry_after, 0.01)
+        
+        return True, "OK", 0
     
     async def record_request(self):
         """Record a request"""
         async with self.lock:
-            self.requests.append(datetime.now())
-            await self.save_tracking()
+            now = time.time()
+            self._expire(now)
+            self._append(now)
+            await self._maybe_save(now)
     
     async def get_status(self) -> Dict:
         """Get current rate limit status"""
         async with self.lock:
-            now = datetime.now()
-            
-            last_hour = [
-                req for req in self.requests 
-                if now - req < timedelta(hours=1)
-            ]
+            self._expire(time.time())
             
             return {
-                "requests_last_hour": len(last_hour),
+                "requests_last_hour": len(self.last_hour),
                 "requests_last_day": len(self.requests),
-                "remaining_hour": self.per_hour - len(last_hour),
+                "remaining_hour": self.per_hour - len(self.last_hour),
                 "remaining_day": self.per_day - len(self.requests)
             }
     
+    async def _maybe_save(self, now: float):
+        """Save tracking data unless it was saved within SAVE_INTERVAL"""
+        if now - self._last_save >= self.SAVE_INTERVAL:
+            await self.save_tracking()
+    
+    async def close(self):
+        """Write out requests recorded since the last save"""
+        async with self.lock:
+            await self.save_tracking()
+    
     async def save_tracking(self):
         """Save tracking data to file"""
         data = {
-            "requests": [req.isoformat() for req in self.requests]
+            "requests": [datetime.fromtimestamp(req).isoformat() for req in self.requests]
         }
         async with aiofiles.open(self.tracking_file, 'w') as f:
             await f.write(json.dumps(data))
+        self._last_save = time.time()
     
     async def load_tracking(self):
         """Load tracking data from file"""
         if os.path.exists(self.tracking_file):
             async with aiofiles.open(self.tracking_file, 'r') as f:
                 data = json.loads(await f.read())
-                self.requests = [
-                    datetime.fromisoformat(req) 
-                    for req in data.get("requests", [])
-                ]
\ No newline at end of file
+                self.requests.clear()
+                self.last_hour.clear()
+                self.last_second.clear()
+                for req in data.get("requests", []):
+                    self._append(datetime.fromisoformat(req).timestamp())
+                self._expire(time.time())
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Build _bid_data.py from bid_messages.json, skills_map.json and specializations.json
+
+Run from the project root at deploy time. The bot imports the generated
+module (a marshalled .pyc after the first import) instead of parsing the
+JSON files on every start, and falls back to the JSON when it is stale.
+"""
+
+import os
+import json
+
+OUTPUT = '_bid_data.py'
+
+def build():
+    """Write the generated data module"""
+    with open('bid_messages.json', 'r') as f:
+        messages = json.load(f)
+
+    with open('skills_map.json', 'r') as f:
+        # Keyed by job id as int, matching AutoWorkMinimal.load_skills_map
+        skills = {int(k): v for k, v in json.load(f).items()}
+
+    with open('specializations.json', 'r') as f:
+        specializations = json.load(f)
+
+    mtimes = {name: os.path.getmtime(name)
+              for name in ('bid_messages.json', 'skills_map.json', 'specializations.json')}
+
+    with open(OUTPUT, 'w') as f:
+        f.write('# Generated by scripts/build_data.py - do not edit\n')
+        f.write(f'SOURCE_MTIMES = {mtimes!r}\n')
+        f.write(f'MESSAGES = {messages!r}\n')
+        f.write(f'SKILLS = {skills!r}\n')
+        f.write(f'SPECIALIZATIONS = {specializations!r}\n')
+
+    print(f"Wrote {OUTPUT}: {sum(len(v) for v in messages.values())} messages, {len(skills)} skills, "
+          f"{len(specializations)} specializations")
+
+if __name__ == "__main__":
+    build()
@@ -9,6 +9,14 @@ import logging
 from typing import Dict, List, Tuple, Optional
 
 class SpamFilter:
+    # Fixed phrase lists and patterns, built once rather than per project
+    SIMPLE_TASK_KEYWORDS = ('data entry', 'copy paste', 'typing', 'form filling', 'simple task')
+    SIMPLE_TITLE_KEYWORDS = ('data entry', 'typing', 'copy paste')
+    MESSAGING_APPS = ('whatsapp', 'telegram', 'skype', 'discord', 'signal', 'viber')
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    PHONE_PATTERN = re.compile(r'(?:\+\d{1,3}\s?)?(?:\d{10,15}|\(\d{3}\)\s?\d{3}-?\d{4})')
+    REPEATED_CHAR_PATTERN = re.compile(r'(.)\1{4,}')
+    
     def __init__(self):
         # Spam keywords and patterns
         self.spam_keywords = [
@@ -132,7 +140,7 @@ class SpamFilter:
             reasons.extend(budget_check[2])
         
         # 4. Check project metadata
-        meta_check = self._check_metadata(project)
+        meta_check = self._check_metadata(project, title)
         if meta_check[0]:
             spam_score += meta_check[1]
             reasons.extend(meta_check[2])
@@ -222,8 +230,8 @@ class SpamFilter:
         max_budget = budget.get('maximum', 0)
         
         # Check for data entry/simple task with high budget
-        is_simple_task = any(keyword in title + description for keyword in 
-                           ['data entry', 'copy paste', 'typing', 'form filling', 'simple task'])
+        text = title + description
+        is_simple_task = any(keyword in text for keyword in self.SIMPLE_TASK_KEYWORDS)
         
         if is_simple_task and min_budget > self.budget_red_flags['data_entry_max']:
             score += 30
@@ -243,8 +251,8 @@ class SpamFilter:
         
         return score > 0, score, reasons
 
-    def _check_metadata(self, project: Dict) -> Tuple[bool, int, List[str]]:
-        """Check project metadata for red flags"""
+    def _check_metadata(self, project: Dict, title_lower: str) -> Tuple[bool, int, List[str]]:
+        """Check project metadata for red flags (title already lowercased)"""
         score = 0
         reasons = []
         
@@ -258,7 +266,7 @@ class SpamFilter:
                     overall = entire_history.get('overall', 0)
                     reviews = entire_history.get('reviews', 0)
                     
-                    if reviews == 0 and 'urgent' in project.get('title', '').lower():
+                    if reviews == 0 and 'urgent' in title_lower:
                         score += 20
                         reasons.append("New employer with 'urgent' project")
         
@@ -266,8 +274,7 @@ class SpamFilter:
         upgrades = project.get('upgrades', {})
         if isinstance(upgrades, dict):
             has_nda = upgrades.get('NDA', False)
-            is_simple = any(word in project.get('title', '').lower() 
-                          for word in ['data entry', 'typing', 'copy paste'])
+            is_simple = any(word in title_lower for word in self.SIMPLE_TITLE_KEYWORDS)
             
             if has_nda and is_simple:
                 score += 15
@@ -277,7 +284,6 @@ class SpamFilter:
         jobs = project.get('jobs', [])
         if isinstance(jobs, list) and jobs:
             categories = [job.get('name', '').lower() for job in jobs if isinstance(job, dict)]
-            title_lower = project.get('title', '').lower()
             
             # If title mentions data entry but category is programming
             if 'data entry' in title_lower and any('programming' in cat or 'software' in cat for cat in categories):
@@ -287,27 +293,24 @@ class SpamFilter:
         return score > 0, score, reasons
 
     def _check_external_contact(self, text: str) -> Tuple[bool, int, List[str]]:
-        """Check for attempts to move communication off-platform"""
+        """Check for attempts to move communication off-platform (text already lowercased)"""
         score = 0
         reasons = []
         
         # Check for messaging apps
-        messaging_apps = ['whatsapp', 'telegram', 'skype', 'discord', 'signal', 'viber']
-        for app in messaging_apps:
-            if app in text.lower():
+        for app in self.MESSAGING_APPS:
+            if app in text:
                 score += 30
                 reasons.append(f"Requests contact via {app.title()}")
                 break
         
         # Check for email patterns
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        if re.search(email_pattern, text):
+        if self.EMAIL_PATTERN.search(text):
             score += 25
             reasons.append("Contains email address")
         
         # Check for phone numbers
-        phone_pattern = r'(?:\+\d{1,3}\s?)?(?:\d{10,15}|\(\d{3}\)\s?\d{3}-?\d{4})'
-        if re.search(phone_pattern, text):
+        if self.PHONE_PATTERN.search(text):
             score += 25
             reasons.append("Contains phone number")
         
@@ -316,7 +319,7 @@ class SpamFilter:
     def _has_excessive_repetition(self, text: str) -> bool:
         """Check for excessive character or word repetition"""
         # Check for repeated characters (e.g., "!!!!!" or "$$$$")
-        if re.search(r'(.)\1{4,}', text):
+        if self.REPEATED_CHAR_PATTERN.search(text):
             return True
         
         # Check for repeated words
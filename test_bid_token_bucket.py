@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for the bid token bucket in autowork_minimal.py
+Runs offline: no API calls, Redis is fakeredis where needed
+"""
+
+import sys
+import time
+from datetime import datetime
+
+import fakeredis
+
+from autowork.core.autowork_minimal import AutoWorkMinimal
+
+
+def make_bot(burst=1, redis_client=None):
+    """Bot with just the state the bid pacing reads"""
+    bot = AutoWorkMinimal.__new__(AutoWorkMinimal)
+    bot.config = bot.load_config()
+    bot.config['bidding']['bid_burst'] = burst
+    bot.redis_client = redis_client
+    bot.last_bid_time = None
+    bot._bid_tokens = 0.0
+    bot._bids_paused_until = 0.0
+    return bot
+
+
+def test_first_bid_is_free():
+    """A fresh bucket is full, so the first bid never waits"""
+    bot = make_bot()
+    assert bot.bid_wait_seconds() == 0
+    assert not bot.is_rate_limited()
+    print("✅ First bid allowed immediately")
+
+
+def test_spent_token_refills_over_interval():
+    """After a bid the next one waits out the rest of the interval"""
+    bot = make_bot()
+    interval, _ = bot.bid_rate()
+    bot.set_rate_limit_timestamp()
+    assert interval - 1 < bot.bid_wait_seconds() <= interval
+
+    # Half the interval later, half a token has refilled
+    bot.last_bid_time -= interval / 2
+    assert abs(bot.bid_wait_seconds() - interval / 2) < 1
+
+    bot.last_bid_time -= interval / 2
+    assert bot.bid_wait_seconds() == 0
+    print(f"✅ Bucket refills one bid per {interval}s")
+
+
+def test_burst_then_paced():
+    """With bid_burst the bucket allows that many bids back to back, then paces"""
+    bot = make_bot(burst=3)
+    interval, burst = bot.bid_rate()
+    assert burst == 3
+    for _ in range(burst):
+        assert bot.bid_wait_seconds() == 0
+        bot.set_rate_limit_timestamp()
+    assert interval - 1 < bot.bid_wait_seconds() <= interval
+
+    # A long idle spell refills to the burst size, never beyond it
+    bot.last_bid_time -= 100 * interval
+    assert bot.bid_tokens(interval, burst) == burst
+    print(f"✅ Burst of {burst} bids, then one per {interval}s")
+
+
+def test_retry_after_pause():
+    """A 429's Retry-After holds bids even with tokens in the bucket"""
+    bot = make_bot(burst=3)
+    bot._bids_paused_until = time.monotonic() + 30
+    assert 29 < bot.bid_wait_seconds() <= 30
+    bot._bids_paused_until = time.monotonic() - 1
+    assert bot.bid_wait_seconds() == 0
+    print("✅ Retry-After pause honoured")
+
+
+def test_shared_redis_spacing():
+    """Without bursting, a recent bid by another process also spaces ours"""
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    bot = make_bot(redis_client=redis_client)
+    interval, _ = bot.bid_rate()
+    redis_client.set('last_bid_time', datetime.now().isoformat())
+    assert interval - 1 < bot.bid_wait_seconds() <= interval
+
+    # With bursting, pacing is per process and the shared timestamp is ignored
+    bot.config['bidding']['bid_burst'] = 2
+    assert bot.bid_wait_seconds() == 0
+    print("✅ Shared last_bid_time spaces bids across processes")
+
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Bid Token Bucket")
+    print("=" * 50)
+
+    tests = [
+        ("First Bid", test_first_bid_is_free),
+        ("Refill", test_spent_token_refills_over_interval),
+        ("Burst", test_burst_then_paced),
+        ("Retry-After Pause", test_retry_after_pause),
+        ("Shared Redis Spacing", test_shared_redis_spacing),
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing: {test_name}")
+        try:
+            test_func()
+            passed += 1
+        except Exception as e:
+            print(f"   ❌ {test_name} failed: {e!r}")
+
+    print(f"\n📊 Test Results: {passed}/{total} tests passed")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the processed-projects Redis storage in autowork_minimal.py
+Runs offline against fakeredis: the legacy JSON blob is migrated into the
+processed_projects_zset sorted set on the first save
+"""
+
+import os
+import sys
+import json
+
+import fakeredis
+
+# Point the bot at a closed port so startup falls back to "no Redis";
+# each test then hands it a fakeredis client
+os.environ.setdefault('FREELANCER_OAUTH_TOKEN', 'test_token_for_migration')
+os.environ['REDIS_URL'] = 'redis://127.0.0.1:1'
+
+from autowork.core.autowork_minimal import AutoWorkMinimal
+
+
+def make_bot(redis_client):
+    """Initialize a bot offline and load its state from redis_client"""
+    original_verify = AutoWorkMinimal.verify_token_on_startup
+    AutoWorkMinimal.verify_token_on_startup = lambda self: True
+    try:
+        bot = AutoWorkMinimal()
+    finally:
+        AutoWorkMinimal.verify_token_on_startup = original_verify
+    bot.redis_client = redis_client
+    bot.load_state_from_redis()
+    return bot
+
+
+def test_legacy_blob_migrates_to_zset():
+    """Ids in the old JSON blob end up in the sorted set and the blob is deleted"""
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    redis_client.set('processed_projects', json.dumps([101, 102, 103]))
+
+    bot = make_bot(redis_client)
+    assert {101, 102, 103} <= bot.processed_projects
+
+    bot.save_state_to_redis(force=True)
+    stored = {int(pid) for pid in redis_client.zrange(AutoWorkMinimal.PROCESSED_PROJECTS_KEY, 0, -1)}
+    assert stored == {101, 102, 103}, stored
+    assert not redis_client.exists('processed_projects')
+
+    # The next run reads the sorted set alone
+    restarted = make_bot(redis_client)
+    assert {101, 102, 103} <= restarted.processed_projects
+    assert not restarted._legacy_processed_blob
+    print("✅ Legacy blob migrated into the sorted set")
+
+
+def test_zset_preferred_over_stale_blob():
+    """When the sorted set exists, a leftover blob is not read back in"""
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    redis_client.zadd(AutoWorkMinimal.PROCESSED_PROJECTS_KEY, {201: 1.0, 202: 2.0})
+    redis_client.set('processed_projects', json.dumps([999]))
+
+    bot = make_bot(redis_client)
+    assert {201, 202} <= bot.processed_projects
+    assert 999 not in bot.processed_projects
+    print("✅ Sorted set takes precedence over a stale blob")
+
+
+def test_zset_trimmed_to_cap():
+    """Saves keep only the newest PROCESSED_PROJECTS_CAP ids"""
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    cap = AutoWorkMinimal.PROCESSED_PROJECTS_CAP
+    redis_client.zadd(AutoWorkMinimal.PROCESSED_PROJECTS_KEY,
+                      {pid: float(pid) for pid in range(1, cap + 1)})
+
+    bot = make_bot(redis_client)
+    for pid in range(cap + 1, cap + 6):
+        bot.mark_processed(pid)
+    bot.save_state_to_redis(force=True)
+
+    stored = redis_client.zrange(AutoWorkMinimal.PROCESSED_PROJECTS_KEY, 0, -1)
+    assert len(stored) == cap, len(stored)
+    assert '1' not in stored and str(cap + 5) in stored
+    print(f"✅ Sorted set trimmed to {cap} ids")
+
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Processed Projects Migration")
+    print("=" * 50)
+
+    tests = [
+        ("Legacy Blob Migration", test_legacy_blob_migrates_to_zset),
+        ("Sorted Set Precedence", test_zset_preferred_over_stale_blob),
+        ("Sorted Set Cap", test_zset_trimmed_to_cap),
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing: {test_name}")
+        try:
+            test_func()
+            passed += 1
+        except Exception as e:
+            print(f"   ❌ {test_name} failed: {e!r}")
+
+    print(f"\n📊 Test Results: {passed}/{total} tests passed")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
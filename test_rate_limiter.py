@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test script for rate_limiter.py
+Runs offline: exercises the RateLimiter windows and its tracking file
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import tempfile
+from datetime import datetime
+
+from rate_limiter import RateLimiter
+
+
+def make_limiter(tmpdir, **limits):
+    """Create a limiter that writes its tracking file into tmpdir"""
+    limiter = RateLimiter(**limits)
+    limiter.tracking_file = os.path.join(tmpdir, "rate_limit_tracking.json")
+    return limiter
+
+
+def test_concurrent_acquire_spacing():
+    """Concurrent acquire() calls never exceed per_second in any 1s window"""
+    async def run(tmpdir):
+        limiter = make_limiter(tmpdir, per_second=2, per_hour=100, per_day=100)
+        results = await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+        return results, sorted(limiter.last_hour)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results, stamps = asyncio.run(run(tmpdir))
+
+    assert all(ok for ok, _ in results), results
+    assert len(stamps) == 6, stamps
+    # Any third request comes at least a second after the one two before it
+    for earlier, later in zip(stamps, stamps[2:]):
+        assert later - earlier >= 0.99, stamps
+    print("✅ Concurrent acquires spaced to 2 per second")
+
+
+def test_hourly_limit_rejects():
+    """acquire() returns False at the hourly limit instead of waiting it out"""
+    async def run(tmpdir):
+        limiter = make_limiter(tmpdir, per_second=100, per_hour=3, per_day=100)
+        for _ in range(3):
+            assert (await limiter.acquire())[0]
+        started = time.monotonic()
+        ok, reason = await limiter.acquire()
+        return ok, reason, time.monotonic() - started, await limiter.get_status()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ok, reason, elapsed, status = asyncio.run(run(tmpdir))
+
+    assert not ok and "per hour" in reason, reason
+    assert elapsed < 0.5, elapsed
+    assert status["requests_last_hour"] == 3 and status["remaining_hour"] == 0, status
+    print(f"✅ Hourly limit rejected: {reason}")
+
+
+def test_daily_limit_rejects():
+    """acquire() returns False at the daily limit instead of waiting it out"""
+    async def run(tmpdir):
+        limiter = make_limiter(tmpdir, per_second=100, per_hour=100, per_day=2)
+        for _ in range(2):
+            assert (await limiter.acquire())[0]
+        can_request, _ = await limiter.can_make_request()
+        ok, reason = await limiter.acquire()
+        return can_request, ok, reason
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        can_request, ok, reason = asyncio.run(run(tmpdir))
+
+    assert not can_request
+    assert not ok and "per day" in reason, reason
+    print(f"✅ Daily limit rejected: {reason}")
+
+
+def test_tracking_round_trip():
+    """save_tracking/load_tracking restore the windows and drop expired entries"""
+    async def run(tmpdir):
+        limiter = make_limiter(tmpdir, per_second=100, per_hour=100, per_day=100)
+        for _ in range(3):
+            await limiter.record_request()
+        await limiter.close()
+
+        # An entry from two days ago has left every window by the next load
+        with open(limiter.tracking_file) as f:
+            data = json.load(f)
+        data["requests"].insert(0, datetime.fromtimestamp(time.time() - 2 * 86400).isoformat())
+        with open(limiter.tracking_file, "w") as f:
+            json.dump(data, f)
+
+        restored = make_limiter(tmpdir, per_second=100, per_hour=100, per_day=100)
+        await restored.load_tracking()
+        return list(limiter.requests), list(restored.requests), await restored.get_status()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        saved, restored, status = asyncio.run(run(tmpdir))
+
+    assert len(restored) == 3, restored
+    # Timestamps go through isoformat, so compare to the microsecond
+    assert all(abs(a - b) < 1e-5 for a, b in zip(saved, restored)), (saved, restored)
+    assert status["requests_last_hour"] == 3 and status["requests_last_day"] == 3, status
+    print("✅ Tracking file round trip restored 3 requests")
+
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing RateLimiter")
+    print("=" * 50)
+
+    tests = [
+        ("Concurrent Acquire Spacing", test_concurrent_acquire_spacing),
+        ("Hourly Limit", test_hourly_limit_rejects),
+        ("Daily Limit", test_daily_limit_rejects),
+        ("Tracking Round Trip", test_tracking_round_trip),
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing: {test_name}")
+        try:
+            test_func()
+            passed += 1
+        except Exception as e:
+            print(f"   ❌ {test_name} failed: {e!r}")
+
+    print(f"\n📊 Test Results: {passed}/{total} tests passed")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -2,9 +2,9 @@ from fastapi import FastAPI, HTTPException
 from fastapi.responses import HTMLResponse
 import uvicorn
 from datetime import datetime, timedelta
-from sqlalchemy import select, func
+from sqlalchemy import select
 
-from database import init_db, Project, Bid
+from database import init_db, summary_counts_query, Project, Bid
 from config import settings
 
 app = FastAPI(title="AutoWork Dashboard")
@@ -63,16 +63,13 @@ async def dashboard():
 async def get_stats():
     """Get summary statistics"""
     async with db_session() as session:
-        # Get various stats
-        total_projects = await session.scalar(select(func.count(Project.id)))
-        today_projects = await session.scalar(
-            select(func.count(Project.id))
-            .where(Project.created_at > datetime.now() - timedelta(days=1))
-        )
-        total_bids = await session.scalar(select(func.count(Bid.id)))
-        successful_bids = await session.scalar(
-            select(func.count(Bid.id)).where(Bid.status == "success")
+        # Get various stats in one round trip
+        result = await session.execute(
+            summary_counts_query(datetime.utcnow() - timedelta(days=1))
         )
+        total_projects, today_projects, total_bids, successful_bids = result.one()
+    
+    success_rate = f"{successful_bids / total_bids * 100:.1f}%" if total_bids > 0 else "N/A"
     
     return f"""
     <div class="grid grid-cols-2 gap-4">
@@ -91,7 +88,7 @@ async def get_stats():
         <div>
             <p class="text-gray-600">Success Rate</p>
             <p class="text-2xl font-bold">
-                {(successful_bids/total_bids*100):.1f}% if total_bids > 0 else "N/A"}
+                {success_rate}
             </p>
         </div>
     </div>